@@ -3,8 +3,13 @@
 # Parses the ASCII cube animation frames from the crackGPT web client,
 # converts characters to brightness, scales to 64x64, and renders in green.
 
-import math
-import re
+import functools
+import os
+import zlib
+from pathlib import Path
+
+import numpy as np
+
 from ledmatrix import Canvas, run
 
 ASCII_FILE = "/home/cowboy/projects/active/crackGPT/web-client/src/components/ascii.ts"
@@ -16,56 +21,70 @@ BRIGHTNESS = {
     "*": 0.55, "=": 0.65, "%": 0.75, "#": 0.85, "@": 1.0,
 }
 
+# Byte value → brightness; characters missing from BRIGHTNESS read as 0.5
+BRIGHT_LUT = np.full(256, 0.5, dtype=np.float32)
+for _ch, _level in BRIGHTNESS.items():
+    BRIGHT_LUT[ord(_ch)] = _level
+
 # Frame timing (matches ChatInterface.tsx)
 FRAME_MS = 180       # ms per frame
 END_PAUSE_MS = 60000  # hold last frame
 CHAR_ASPECT = 0.5    # monospace char width/height ratio
 
+# Cached frames are keyed by the settings that shape them; bump CACHE_VERSION
+# whenever _parse_frames/_scale change their output
+CACHE_VERSION = 1
+_CACHE_KEY = zlib.crc32(repr((CACHE_VERSION, sorted(BRIGHTNESS.items()), CHAR_ASPECT)).encode())
+CACHE_FILE = Path(f"~/.cache/leds/caesar_frames_{_CACHE_KEY:08x}.npy").expanduser()
+
 
 def _parse_frames():
-    """Parse ASCII frames from TS file and pre-scale to 64x64 brightness grids."""
+    """Parse ASCII frames from TS file and pre-scale to 64x64 brightness grids.
+
+    Returns a (num_frames, 64, 64) uint8 array of brightness × 255 (num_frames
+may be 0 if no frame literal parses).
+    """
     with open(ASCII_FILE) as f:
         content = f.read()
 
-    raw = re.findall(r"`\n(.*?)\n`", content, re.DOTALL)
+    # Frames are template literals whose backticks sit on their own lines
+    literals = content.split("`")[1::2]
+    raw = [lit[1:-1] for lit in literals if lit.startswith("\n") and lit.endswith("\n")]
     frames = []
 
     for text in raw:
         lines = text.split("\n")
+        # One byte per character, padded with spaces into a rectangle
+        width = max(len(line) for line in lines)
+        padded = "".join(line.ljust(width) for line in lines)
+        chars = np.frombuffer(padded.encode("latin-1", "replace"), dtype=np.uint8)
+        chars = chars.reshape(len(lines), width)
+
         # Find bounding box of non-space content
-        min_x, max_x = len(lines[0]) if lines else 0, 0
-        min_y, max_y = len(lines), 0
-        for y, line in enumerate(lines):
-            for x, ch in enumerate(line):
-                if ch not in (" ", "\xa0"):
-                    min_x = min(min_x, x)
-                    max_x = max(max_x, x + 1)
-                    min_y = min(min_y, y)
-                    max_y = max(max_y, y + 1)
-        if max_x <= min_x or max_y <= min_y:
+        ys, xs = np.nonzero((chars != 0x20) & (chars != 0xA0))
+        if not len(ys):
             continue
-
-        src_w = max_x - min_x
-        src_h = max_y - min_y
+        crop = chars[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+        src_h, src_w = crop.shape
 
         # Build brightness grid for the cropped region
-        grid = []
-        for y in range(min_y, max_y):
-            row = []
-            line = lines[y] if y < len(lines) else ""
-            for x in range(min_x, max_x):
-                ch = line[x] if x < len(line) else " "
-                row.append(BRIGHTNESS.get(ch, 0.5))
-            grid.append(row)
+        grid = BRIGHT_LUT[crop]
 
         # Scale to 64x64 with aspect ratio correction
         frames.append(_scale(grid, src_w, src_h))
 
-    return frames
+    if not frames:
+        return np.zeros((0, 64, 64), dtype=np.uint8)
+    return np.stack(frames)
 
 
-def _scale(grid, src_w, src_h, size=64):
-    """Area-average downsample to size×size with char aspect ratio correction."""
+@functools.lru_cache(maxsize=None)
+def _scale_plan(src_w, src_h, size=64):
+    """Bucket edges, averaging weights and placement for scaling a src_w×src_h grid.
+
+    Animation frames mostly share a crop size, so this is computed once per
+    distinct (src_w, src_h) and reused by _scale.
+    """
     # Visual dimensions accounting for monospace char proportions
     vis_w = src_w * CHAR_ASPECT
     vis_h = src_h
@@ -75,61 +94,86 @@ def _scale(grid, src_w, src_h, size=64):
     off_x = (size - fit_w) // 2
     off_y = (size - fit_h) // 2
 
-    out = [[0.0] * size for _ in range(size)]
-
-    for dy in range(fit_h):
-        # Source y range for this destination row
-        sy0 = dy * src_h / fit_h
-        sy1 = (dy + 1) * src_h / fit_h
-        iy0 = int(sy0)
-        iy1 = min(int(math.ceil(sy1)), src_h)
-
-        for dx in range(fit_w):
-            # Source x range for this destination column
-            sx0 = dx * src_w / fit_w
-            sx1 = (dx + 1) * src_w / fit_w
-            ix0 = int(sx0)
-            ix1 = min(int(math.ceil(sx1)), src_w)
+    # Source bucket boundaries for each destination row/column
+    edges_y = np.arange(fit_h + 1) * src_h // fit_h
+    edges_x = np.arange(fit_w + 1) * src_w // fit_w
+    # When a frame is upscaled a bucket can be empty; reduceat then yields the
+    # single source cell at that edge, so clamp its size to 1 (nearest neighbour).
+    counts = np.outer(np.maximum(np.diff(edges_y), 1), np.maximum(np.diff(edges_x), 1))
+    weights = (1.0 / counts).astype(np.float32)
+    return edges_y[:-1], edges_x[:-1], weights, off_y, off_x
 
-            # Area average
-            total = 0.0
-            count = 0
-            for iy in range(iy0, iy1):
-                for ix in range(ix0, ix1):
-                    total += grid[iy][ix]
-                    count += 1
 
-            out[dy + off_y][dx + off_x] = total / count if count else 0.0
-
-    return out
+def _scale(grid, src_w, src_h, size=64):
+    """Area-average downsample to size×size with char aspect ratio correction."""
+    starts_y, starts_x, weights, off_y, off_x = _scale_plan(src_w, src_h, size)
+    fit_h, fit_w = weights.shape
+
+    # Sum each bucket with two reductions: rows first, then columns
+    grid = np.asarray(grid, dtype=np.float32)
+    sums = np.add.reduceat(grid, starts_y, axis=0)
+    sums = np.add.reduceat(sums, starts_x, axis=1)
+
+    out = np.zeros((size, size), dtype=np.float32)
+    out[off_y:off_y + fit_h, off_x:off_x + fit_w] = sums * weights
+    return (out * 255).astype(np.uint8)
+
+
+def _colorize(frames):
+    """Turn (n, 64, 64) brightness frames into (n, 64, 64, 3) green RGB images."""
+    levels = np.where(frames > 2, frames, 0).astype(np.uint16)  # brightness > 0.01
+    images = np.zeros(frames.shape + (3,), dtype=np.uint8)
+    images[..., 1] = levels * 140 // 255
+    images[..., 2] = levels * 30 // 255
+    return images
+
+
+def _load_frames():
+    """Load pre-scaled frames from the on-disk cache, re-parsing when ASCII_FILE changed."""
+    try:
+        src_mtime = Path(ASCII_FILE).stat().st_mtime
+    except FileNotFoundError:
+        src_mtime = 0.0
+    if CACHE_FILE.exists() and CACHE_FILE.stat().st_mtime >= src_mtime:
+        try:
+            return np.load(CACHE_FILE, mmap_mode="r")
+        except (OSError, ValueError, EOFError):
+            pass  # Unreadable cache: re-parse and overwrite it
+    frames = _parse_frames()
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # Write aside and rename, so an interrupted save never leaves a truncated cache
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, frames)
+    os.replace(tmp, CACHE_FILE)
+    return frames
 
 
-# Pre-compute all frames at import time
-FRAMES = _parse_frames()
-NUM_FRAMES = len(FRAMES)
 FRAME_S = FRAME_MS / 1000.0
 END_PAUSE_S = END_PAUSE_MS / 1000.0
-CYCLE_S = (NUM_FRAMES - 1) * FRAME_S + END_PAUSE_S
+
+# RGB image per frame, loaded on first render so importing stays cheap
+_images = None
 
 
 def render(canvas: Canvas, t: float, frame: int) -> None:
-    canvas.clear()
+    global _images
+    if _images is None:
+        _images = _colorize(_load_frames())
+    num_frames = len(_images)
+    if not num_frames:
+        canvas.clear()
+        return
 
     # Determine which ASCII frame to show
-    t_cycle = t % CYCLE_S
-    normal_duration = (NUM_FRAMES - 1) * FRAME_S
+    normal_duration = (num_frames - 1) * FRAME_S
+    t_cycle = t % (normal_duration + END_PAUSE_S)
     if t_cycle < normal_duration:
         idx = int(t_cycle / FRAME_S)
     else:
-        idx = NUM_FRAMES - 1
-
-    brightness_grid = FRAMES[idx]
+        idx = num_frames - 1
 
-    for y in range(64):
-        for x in range(64):
-            b = brightness_grid[y][x]
-            if b > 0.01:
-                canvas.set(x, y, (0, int(b * 140), int(b * 30)))
+    canvas.blit(_images[idx])
 
 
 if __name__ == "__main__":
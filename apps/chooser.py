@@ -1,6 +1,9 @@
 """Demo Chooser - cycle through demos with board buttons or arrow keys."""
 
+import ast
+import functools
 import importlib.util
+import pickle
 import socket
 import sys
 import time
@@ -16,26 +19,91 @@ BUTTON_PORT = 7778
 BTN_UP_CODE = 0x01
 BTN_DOWN_CODE = 0x02
 OVERLAY_DURATION = 2.0
+KEY_STEPS = {pygame.K_UP: -1, pygame.K_DOWN: 1}  # Arrow key -> demo index step
+CACHE_FILE = Path("~/.cache/leds/chooser_apps.pkl").expanduser()
+
+btn_buf = bytearray(16)  # Reused receive buffer for button packets
 
 
 def discover_apps():
-    """Scan apps/*.py, import each, return list of (name, render_fn) tuples."""
+    """Scan apps/*.py for a top-level render(), return list of (name, path) tuples.
+
+    Files are only parsed, not imported; see load_render(). The result is
+    cached in CACHE_FILE until a file in apps/ is added, removed or modified.
+    """
     apps_dir = Path(__file__).parent
+    py_files = sorted(apps_dir.glob("*.py"))
+    stamp = (str(apps_dir), apps_dir.stat().st_mtime, max(p.stat().st_mtime for p in py_files))
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cached_stamp, demos = pickle.load(f)
+        if cached_stamp == stamp:
+            return demos
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
     demos = []
-    for py_file in sorted(apps_dir.glob("*.py")):
+    for py_file in py_files:
         if py_file.name == "chooser.py":
             continue
-        module_name = py_file.stem
         try:
-            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            tree = ast.parse(py_file.read_text(), filename=str(py_file))
+        except (OSError, SyntaxError) as e:
+            print(f"[chooser] Skipping {py_file.name}: {e}")
+            continue
+        if any(isinstance(node, ast.FunctionDef) and node.name == "render" for node in tree.body):
+            display_name = py_file.stem.upper().replace("_", " ")
+            demos.append((display_name, py_file))
+
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "wb") as f:
+            pickle.dump((stamp, demos), f)
+    except OSError as e:
+        print(f"[chooser] Could not write app cache: {e}")
+    return demos
+
+
+_renders = {}  # path -> render_fn, or None if the module failed to import
+
+
+def load_render(path):
+    """Import an app the first time it is shown and return its render function."""
+    if path not in _renders:
+        try:
+            spec = importlib.util.spec_from_file_location(path.stem, path)
             mod = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(mod)
-            if hasattr(mod, "render") and callable(mod.render):
-                display_name = module_name.upper().replace("_", " ")
-                demos.append((display_name, mod.render))
+            _renders[path] = mod.render
         except Exception as e:
-            print(f"[chooser] Skipping {py_file.name}: {e}")
-    return demos
+            print(f"[chooser] Could not load {path.name}: {e}")
+            _renders[path] = None
+    return _renders[path]
+
+
+def next_demo(current, step, count, broken):
+    """Move step (+1/-1) through count demos, skipping indexes in broken."""
+    for _ in range(count):
+        current = (current + step) % count
+        if current not in broken:
+            break
+    return current
+
+
+@functools.lru_cache(maxsize=None)
+def render_overlay(name, index, count):
+    """Rasterize the demo name + position banner once, for blitting at y=26.
+
+    Cached per demo, so text widths and the index label are computed only
+    the first time each demo is selected.
+    """
+    banner = Canvas(64, 14)
+    text_width = len(name) * 4 - 1
+    banner.text(max(0, (64 - text_width) // 2), 3, name, (255, 255, 255))
+    idx_text = f"{index + 1}/{count}"
+    idx_width = len(idx_text) * 4 - 1
+    banner.text(max(0, (64 - idx_width) // 2), 9, idx_text, (120, 120, 120))
+    return banner
 
 
 def create_button_listener():
@@ -67,12 +135,10 @@ def main():
     btn_sock = create_button_listener()
 
     current = 0
-    overlay_name = demos[0][0]
+    broken = set()  # Demos whose render failed; skipped from then on
+    overlay = render_overlay(demos[0][0], 0, len(demos))
     overlay_until = time.monotonic() + OVERLAY_DURATION
 
-    key_up_prev = False
-    key_down_prev = False
-
     start = time.monotonic()
     frame = 0
     fps = 30
@@ -86,56 +152,49 @@ def main():
             if btn_sock is not None:
                 try:
                     while True:
-                        data, _ = btn_sock.recvfrom(16)
-                        if len(data) >= 1:
-                            if data[0] == BTN_UP_CODE:
-                                current = (current - 1) % len(demos)
-                                overlay_name = demos[current][0]
+                        n = btn_sock.recv_into(btn_buf)
+                        if n >= 1:
+                            if btn_buf[0] == BTN_UP_CODE:
+                                current = next_demo(current, -1, len(demos), broken)
+                                overlay = render_overlay(demos[current][0], current, len(demos))
                                 overlay_until = now + OVERLAY_DURATION
-                            elif data[0] == BTN_DOWN_CODE:
-                                current = (current + 1) % len(demos)
-                                overlay_name = demos[current][0]
+                            elif btn_buf[0] == BTN_DOWN_CODE:
+                                current = next_demo(current, 1, len(demos), broken)
+                                overlay = render_overlay(demos[current][0], current, len(demos))
                                 overlay_until = now + OVERLAY_DURATION
                 except BlockingIOError:
                     pass
 
-            # --- Poll keyboard arrows ---
-            keys = pygame.key.get_pressed()
-            key_up_now = keys[pygame.K_UP]
-            key_down_now = keys[pygame.K_DOWN]
-
-            if key_up_now and not key_up_prev:
-                current = (current - 1) % len(demos)
-                overlay_name = demos[current][0]
-                overlay_until = now + OVERLAY_DURATION
-
-            if key_down_now and not key_down_prev:
-                current = (current + 1) % len(demos)
-                overlay_name = demos[current][0]
-                overlay_until = now + OVERLAY_DURATION
-
-            key_up_prev = key_up_now
-            key_down_prev = key_down_now
+            # --- Keyboard arrows (KEYDOWN edges collected by sim.update) ---
+            for key in sim.keys_down:
+                step = KEY_STEPS.get(key)
+                if step is not None:
+                    current = next_demo(current, step, len(demos), broken)
+                    overlay = render_overlay(demos[current][0], current, len(demos))
+                    overlay_until = now + OVERLAY_DURATION
 
             # --- Render current demo ---
-            name, render_fn = demos[current]
-            try:
-                render_fn(canvas, t, frame)
-            except Exception:
-                canvas.clear()
-                canvas.text(4, 28, "ERROR", (255, 0, 0))
-                canvas.text(4, 36, name[:10], (180, 180, 180))
+            name, path = demos[current]
+            if current not in broken:
+                render_fn = load_render(path)
+                try:
+                    if render_fn is None:
+                        raise ImportError(path.name)
+                    render_fn(canvas, t, frame)
+                except Exception as e:
+                    print(f"[chooser] {name} failed, removing it from rotation: {e!r}")
+                    broken.add(current)
+                    if len(broken) < len(demos):
+                        current = next_demo(current, 1, len(demos), broken)
+                        overlay = render_overlay(demos[current][0], current, len(demos))
+                        overlay_until = now + OVERLAY_DURATION
+                    canvas.clear()
+                    canvas.text(4, 28, "ERROR", (255, 0, 0))
+                    canvas.text(4, 36, name[:10], (180, 180, 180))
 
             # --- Draw overlay ---
             if now < overlay_until:
-                canvas.rect(0, 26, 64, 12, (0, 0, 0), filled=True)
-                text_width = len(overlay_name) * 4 - 1
-                text_x = max(0, (64 - text_width) // 2)
-                canvas.text(text_x, 29, overlay_name, (255, 255, 255))
-                idx_text = f"{current + 1}/{len(demos)}"
-                idx_width = len(idx_text) * 4 - 1
-                idx_x = max(0, (64 - idx_width) // 2)
-                canvas.text(idx_x, 35, idx_text, (120, 120, 120))
+                canvas.blit(overlay, 0, 26)
 
             # --- Update display ---
             if not sim.update():
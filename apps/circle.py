@@ -1,11 +1,13 @@
+import math
+
 from ledmatrix import Canvas, run
 
 def render(canvas: Canvas, t: float, frame: int) -> None:
     canvas.clear()
     # Pulsing radius
-    r = int(10 + 8 * __import__('math').sin(t * 2))
+    r = int(10 + 8 * math.sin(t * 2))
     # Color-cycling circle
-    color = canvas.hsv((t * 60) % 360)
+    color = canvas.hsv_lut()[int(t * 60) % 360]
     canvas.circle(32, 32, r, color, filled=True)
 
 if __name__ == "__main__":
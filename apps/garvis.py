@@ -1,13 +1,13 @@
 """Garvis voice assistant - LED matrix client with face + captions."""
 
 import asyncio
+import concurrent.futures
+import functools
 import io
 import json
 import math
 import os
-import queue
 import socket
-import subprocess
 import sys
 import threading
 import time
@@ -17,11 +17,17 @@ from pathlib import Path
 # Suppress PortAudio JACK errors when JACK isn't running
 os.environ.setdefault("JACK_NO_START_SERVER", "1")
 
+import miniaudio
 import numpy as np
 import pygame
 import sounddevice as sd
 import websockets
 
+try:
+    import uvloop  # Optional: faster event loop for the websocket thread (not on Windows)
+except ImportError:
+    uvloop = None
+
 from ledmatrix.canvas import Canvas
 from ledmatrix.simulator import Simulator
 from ledmatrix.sender import Sender
@@ -34,7 +40,11 @@ SAMPLE_RATE_IN = 16000   # Mic capture: 16kHz mono 16-bit (what Garvis expects)
 SAMPLE_RATE_OUT = 44100  # TTS playback: 44.1kHz (ElevenLabs MP3 default)
 CHANNELS = 1
 CHUNK_FRAMES = 1600      # 100ms of audio at 16kHz
+MIC_QUEUE_CHUNKS = 50    # 5s of mic audio waiting to send; oldest dropped beyond that
+PLAYBACK_BLOCK = 480     # Output callback size (~10ms at 48kHz)
+PLAYBACK_BUFFER_SECONDS = 30.0  # TTS arrives faster than realtime; decoder waits when full
 RECONNECT_DELAY = 3.0
+WS_MAX_SIZE = 4 * 1024 * 1024  # Largest websocket message accepted from the server
 
 # --- Layout ---
 EYE_Y = 13
@@ -82,30 +92,19 @@ def _save_config(cfg: dict) -> None:
 # Terminal submenu
 # ---------------------------------------------------------------------------
 
-def _list_input_devices() -> list[tuple[int, str]]:
-    devices = sd.query_devices()
-    result = []
-    for i, d in enumerate(devices):
-        if d["max_input_channels"] > 0:
-            result.append((i, d["name"]))
-    return result
+def _list_input_devices(all_devs) -> list[tuple[int, str]]:
+    return [(i, d["name"]) for i, d in enumerate(all_devs) if d["max_input_channels"] > 0]
 
 
-def _list_output_devices() -> list[tuple[int, str]]:
-    devices = sd.query_devices()
-    result = []
-    for i, d in enumerate(devices):
-        if d["max_output_channels"] > 0:
-            result.append((i, d["name"]))
-    return result
+def _list_output_devices(all_devs) -> list[tuple[int, str]]:
+    return [(i, d["name"]) for i, d in enumerate(all_devs) if d["max_output_channels"] > 0]
 
 
-def _resolve_device(name: str | None, direction: str) -> int | None:
+def _resolve_device(name: str | None, direction: str, all_devs) -> int | None:
     """Resolve a saved device name to its current index, or None for system default."""
     if name is None:
         return None
-    devices = sd.query_devices()
-    for i, d in enumerate(devices):
+    for i, d in enumerate(all_devs):
         if d["name"] == name:
             if direction == "input" and d["max_input_channels"] > 0:
                 return i
@@ -114,10 +113,10 @@ def _resolve_device(name: str | None, direction: str) -> int | None:
     return None
 
 
-def _display_name(saved_name: str | None, direction: str) -> str:
+def _display_name(saved_name: str | None, direction: str, all_devs) -> str:
     if saved_name is None:
         return "System default"
-    idx = _resolve_device(saved_name, direction)
+    idx = _resolve_device(saved_name, direction, all_devs)
     if idx is not None:
         return f"{saved_name} (#{idx})"
     return f"{saved_name} (not found)"
@@ -125,13 +124,15 @@ def _display_name(saved_name: str | None, direction: str) -> str:
 
 def _submenu() -> dict:
     cfg = _load_config()
+    # PortAudio enumeration is slow; query once and refresh only when picking a device
+    all_devs = sd.query_devices()
 
     while True:
         print("\n  GARVIS - LED MATRIX CLIENT")
         print("  " + "=" * 30)
         print(f"\n  Server:  {cfg['host']}")
-        print(f"  Input:   {_display_name(cfg['input_name'], 'input')}")
-        print(f"  Output:  {_display_name(cfg['output_name'], 'output')}")
+        print(f"  Input:   {_display_name(cfg['input_name'], 'input', all_devs)}")
+        print(f"  Output:  {_display_name(cfg['output_name'], 'output', all_devs)}")
         print("\n  Options:")
         print("    h) Set server host")
         print("    i) Select input device")
@@ -149,7 +150,8 @@ def _submenu() -> dict:
                 print(f"  Set server to {cfg['host']}")
 
         elif choice == "i":
-            devices = _list_input_devices()
+            all_devs = sd.query_devices()
+            devices = _list_input_devices(all_devs)
             if not devices:
                 print("  No input devices found.")
                 continue
@@ -171,10 +173,11 @@ def _submenu() -> dict:
             except ValueError:
                 continue
             _save_config(cfg)
-            print(f"  Input: {_display_name(cfg['input_name'], 'input')}")
+            print(f"  Input: {_display_name(cfg['input_name'], 'input', all_devs)}")
 
         elif choice == "o":
-            devices = _list_output_devices()
+            all_devs = sd.query_devices()
+            devices = _list_output_devices(all_devs)
             if not devices:
                 print("  No output devices found.")
                 continue
@@ -196,7 +199,7 @@ def _submenu() -> dict:
             except ValueError:
                 continue
             _save_config(cfg)
-            print(f"  Output: {_display_name(cfg['output_name'], 'output')}")
+            print(f"  Output: {_display_name(cfg['output_name'], 'output', all_devs)}")
 
         elif choice == "s":
             break
@@ -209,8 +212,8 @@ def _submenu() -> dict:
 
     # Resolve names to current indices for the client
     resolved = dict(cfg)
-    resolved["input_device"] = _resolve_device(cfg["input_name"], "input")
-    resolved["output_device"] = _resolve_device(cfg["output_name"], "output")
+    resolved["input_device"] = _resolve_device(cfg["input_name"], "input", all_devs)
+    resolved["output_device"] = _resolve_device(cfg["output_name"], "output", all_devs)
     return resolved
 
 
@@ -219,21 +222,137 @@ def _submenu() -> dict:
 # ---------------------------------------------------------------------------
 
 def _decode_mp3(data: bytes) -> tuple[bytes, int] | None:
-    """Decode MP3 bytes to raw PCM via ffmpeg."""
+    """Decode MP3 bytes to raw PCM in-process via miniaudio."""
     try:
-        proc = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-loglevel", "error",
-             "-i", "pipe:0",
-             "-f", "s16le", "-acodec", "pcm_s16le",
-             "-ac", "1", "-ar", str(SAMPLE_RATE_OUT),
-             "pipe:1"],
-            input=data, capture_output=True, timeout=5,
+        decoded = miniaudio.decode(
+            data,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=CHANNELS,
+            sample_rate=SAMPLE_RATE_OUT,
         )
-        if proc.returncode == 0 and proc.stdout:
-            return proc.stdout, SAMPLE_RATE_OUT
-    except Exception:
-        pass
-    return None
+    except Exception as e:
+        print(f"[garvis] MP3 decode error: {e}")
+        return None
+    if not decoded.samples:
+        return None
+    return decoded.samples.tobytes(), SAMPLE_RATE_OUT
+
+
+# MPEG audio Layer III header tables, keyed by the 2-bit version id
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG-2
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG-2.5
+}
+_MP3_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+MP3_PRIME_FRAMES = 2  # frames re-decoded ahead of new data to refill the bit reservoir
+
+
+def _mp3_frame_len(buf: bytearray, i: int) -> int:
+    """Byte length of the Layer III frame whose header starts at buf[i], or 0."""
+    b1, b2 = buf[i + 1], buf[i + 2]
+    if buf[i] != 0xFF or b1 & 0xE0 != 0xE0:
+        return 0
+    version = (b1 >> 3) & 3
+    br_idx = b2 >> 4
+    sr_idx = (b2 >> 2) & 3
+    if version == 1 or (b1 >> 1) & 3 != 1 or not 0 < br_idx < 15 or sr_idx == 3:
+        return 0
+    bitrate = _MP3_BITRATES[version][br_idx] * 1000
+    coeff = 144 if version == 3 else 72
+    return coeff * bitrate // _MP3_RATES[version][sr_idx] + ((b2 >> 1) & 1)
+
+
+class _Mp3Stream:
+    """Incremental MP3 decoder for TTS audio arriving in arbitrary byte chunks.
+
+    Only whole frames are decoded; a trailing partial frame waits for the next
+    chunk. The last few frames are re-fed ahead of new data (and their output
+    discarded) so the bit reservoir and MDCT overlap carry across chunks.
+    """
+
+    def __init__(self):
+        self._pending = bytearray()
+        self._prime: list[bytes] = []
+        self._prime_bytes = 0  # PCM bytes the prime frames decode to on their own
+        self._tag_left = 0     # bytes of an ID3v2 tag still to skip in later chunks
+        self._synced = True    # False after skipping junk until a frame is confirmed
+
+    def continues(self, data: bytes) -> bool:
+        """True if data belongs to this MP3 stream rather than being raw PCM.
+
+        Mid-stream chunks may start anywhere in a frame, so a partial frame
+        already pending claims the chunk; otherwise it must open with an ID3
+        tag or a Layer III frame header.
+        """
+        if self._pending or self._tag_left or data[:3] == b"ID3":
+            return True
+        return len(data) >= 4 and _mp3_frame_len(data, 0) > 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Append data and return PCM for every frame it completed."""
+        buf = self._pending
+        buf += data
+        if self._tag_left:
+            skipped = min(self._tag_left, len(buf))
+            del buf[:skipped]
+            self._tag_left -= skipped
+        frames = []
+        i = 0
+        while i + 4 <= len(buf):
+            if buf[i:i + 3] == b"ID3":
+                # ID3v2 tag: skip its syncsafe size (+ footer), payload may look like frame headers
+                if i + 10 > len(buf):
+                    break
+                size = 10 + ((buf[i + 6] & 0x7F) << 21 | (buf[i + 7] & 0x7F) << 14
+                             | (buf[i + 8] & 0x7F) << 7 | (buf[i + 9] & 0x7F))
+                if buf[i + 5] & 0x10:
+                    size += 10
+                if i + size > len(buf):
+                    self._tag_left = i + size - len(buf)
+                    i = len(buf)
+                    break
+                i += size
+                continue
+            n = _mp3_frame_len(buf, i)
+            if not n:
+                i += 1  # resync past junk
+                self._synced = False
+                continue
+            if not self._synced:
+                # After a resync, only trust a header whose successor also validates
+                if i + n + 4 > len(buf):
+                    break
+                if not _mp3_frame_len(buf, i + n):
+                    i += 1
+                    continue
+                self._synced = True
+            if i + n > len(buf):
+                break
+            frames.append(bytes(buf[i:i + n]))
+            i += n
+        del buf[:i]
+        if not frames:
+            return b""
+
+        result = _decode_mp3(b"".join(self._prime + frames))
+        self._prime = (self._prime + frames)[-MP3_PRIME_FRAMES:]
+        skip = self._prime_bytes
+        primed = _decode_mp3(b"".join(self._prime))
+        self._prime_bytes = len(primed[0]) if primed else 0
+        return result[0][skip:] if result else b""
+
+
+@functools.lru_cache(maxsize=16)
+def _interp_grid(n_in: int, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Output and input sample positions for resampling n_in samples to n_out."""
+    return np.linspace(0, n_in, n_out, endpoint=False), np.arange(n_in)
+
+
+def _resample(samples: np.ndarray, n_out: int) -> np.ndarray:
+    """Linearly resample a 1-D signal to n_out samples (returns float64)."""
+    x_new, x_old = _interp_grid(len(samples), n_out)
+    return np.interp(x_new, x_old, samples)
 
 
 def _parse_audio(data: bytes) -> tuple[bytes, int] | None:
@@ -246,14 +365,61 @@ def _parse_audio(data: bytes) -> tuple[bytes, int] | None:
             return pcm, sr
     except Exception:
         pass
-    # Try MP3/other via ffmpeg
+    # Try MP3 via miniaudio
     return _decode_mp3(data)
 
 
+class _PcmRing:
+    """Single-producer/single-consumer int16 ring buffer feeding the output callback.
+
+    Only the writer advances _write and only the callback advances _read, so
+    no lock is needed.
+    """
+
+    def __init__(self, size: int):
+        self._buf = np.zeros(size, dtype=np.int16)
+        self._size = size
+        self._read = 0   # total samples consumed
+        self._write = 0  # total samples produced
+
+    def available(self) -> int:
+        return self._write - self._read
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy in as many samples as fit; returns the number written."""
+        n = min(len(samples), self._size - self.available())
+        start = self._write % self._size
+        first = min(n, self._size - start)
+        self._buf[start:start + first] = samples[:first]
+        self._buf[:n - first] = samples[first:n]
+        self._write += n
+        return n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Fill out from the ring; returns the number of samples copied."""
+        n = min(len(out), self.available())
+        start = self._read % self._size
+        first = min(n, self._size - start)
+        out[:first] = self._buf[start:start + first]
+        out[first:n] = self._buf[:n - first]
+        self._read += n
+        return n
+
+    def drop(self) -> None:
+        """Discard everything buffered (consumer side: only while no callback runs)."""
+        self._read = self._write
+
+
 # ---------------------------------------------------------------------------
 # WebSocket + audio I/O (runs in background asyncio thread)
 # ---------------------------------------------------------------------------
 
+def _log_decode_error(fut: asyncio.Future) -> None:
+    """Done-callback for decode jobs: report failures instead of dropping them."""
+    if not fut.cancelled() and fut.exception() is not None:
+        print(f"[garvis] Audio decode error: {fut.exception()!r}")
+
+
 class GarvisClient:
     """Manages WebSocket connection, mic capture, and audio playback."""
 
@@ -263,12 +429,24 @@ class GarvisClient:
         self.input_device = input_device
         self.output_device = output_device
         self.state = state
-        self._audio_queue: queue.Queue[bytes] = queue.Queue()
         self._running = True
         self._ws = None
-        self._playing = False       # True while speakers are actively outputting audio
+        self._mp3 = _Mp3Stream()
+        # One worker: decode stays off the event loop but chunks keep their order
+        self._decoder_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="garvis-decode")
+        self._out_rate = SAMPLE_RATE_OUT
+        self._out_stream: sd.OutputStream | None = None
+        # Allocated once: the decode worker may still be writing while sessions change
+        self._ring = _PcmRing(int(SAMPLE_RATE_OUT * PLAYBACK_BUFFER_SECONDS))
         self._play_end_time = 0.0   # monotonic timestamp of last playback finish
 
+    @property
+    def _playing(self) -> bool:
+        """True while speakers are actively outputting audio."""
+        stream = self._out_stream
+        return stream is not None and stream.active and self._ring.available() > 0
+
     async def run(self):
         """Main async loop: connect, capture, receive."""
         while self._running:
@@ -291,26 +469,29 @@ class GarvisClient:
         uri = f"ws://{self.host}/ws/voice"
         print(f"[garvis] Connecting to {uri}...")
 
-        async with websockets.connect(uri) as ws:
+        # TTS audio is already compressed: skip permessage-deflate, allow large MP3 blobs
+        async with websockets.connect(uri, max_size=WS_MAX_SIZE, compression=None) as ws:
             self._ws = ws
+            self._mp3 = _Mp3Stream()
             self.state["status"] = "idle"
             print("[garvis] Connected!")
 
             # Send start signal
             await ws.send(json.dumps({"type": "start"}))
 
-            # Start mic capture in a separate thread
+            loop = asyncio.get_running_loop()
+
+            # Start mic capture and the long-lived speaker stream
             mic_task = asyncio.create_task(self._mic_capture(ws))
-            playback_thread = threading.Thread(
-                target=self._playback_loop, daemon=True
-            )
-            playback_thread.start()
+            out_stream = self._open_output()
 
             try:
                 async for message in ws:
                     if isinstance(message, bytes):
-                        # TTS audio data
-                        self._handle_audio(message)
+                        # TTS audio data: decode on the worker, keep receiving
+                        fut = loop.run_in_executor(self._decoder_pool, self._handle_audio,
+                                                   message, out_stream)
+                        fut.add_done_callback(_log_decode_error)
                     else:
                         # JSON control/transcript
                         self._handle_json(message)
@@ -320,6 +501,9 @@ class GarvisClient:
                     await mic_task
                 except asyncio.CancelledError:
                     pass
+                self._out_stream = None
+                if out_stream:
+                    out_stream.close()
                 self._ws = None
 
     def _handle_json(self, raw: str):
@@ -348,67 +532,74 @@ class GarvisClient:
             else:
                 self.state["status"] = "idle"
 
-    def _handle_audio(self, data: bytes):
-        """Queue incoming TTS audio for playback."""
-        result = _parse_audio(data)
-        if result:
+    def _handle_audio(self, data: bytes, stream: sd.OutputStream | None):
+        """Queue incoming TTS audio for playback as soon as it decodes.
+
+        Audio for a stream that is gone (or never opened) is discarded, so
+        nothing fills a ring no callback drains.
+        """
+        if stream is None or stream is not self._out_stream:
+            return
+        if data[:4] == b"RIFF":
+            result = _parse_audio(data)
+            if not result:
+                return
             pcm, sr = result
-            # Resample if needed to match output sample rate
-            if sr != SAMPLE_RATE_OUT:
-                samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
-                n_out = int(len(samples) * SAMPLE_RATE_OUT / sr)
-                resampled = np.interp(
-                    np.linspace(0, len(samples), n_out, endpoint=False),
-                    np.arange(len(samples)),
-                    samples,
-                ).astype(np.int16)
-                pcm = resampled.tobytes()
-            self._audio_queue.put(pcm)
+        elif self._mp3.continues(data):
+            # MP3 chunks split frames arbitrarily; play each frame once it is whole
+            pcm, sr = self._mp3.feed(data), SAMPLE_RATE_OUT
         else:
-            # Assume raw PCM 24kHz mono 16-bit
-            self._audio_queue.put(data)
+            # Raw PCM (ElevenLabs pcm_* formats): mono 16-bit, played as-is
+            pcm, sr = data[:len(data) & ~1], SAMPLE_RATE_OUT
+        if not pcm:
+            return
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        # Resample straight to the speaker's native rate; the ring write casts to int16
+        if sr != self._out_rate:
+            n_out = int(len(samples) * self._out_rate / sr)
+            samples = _resample(samples, n_out)
+        written = self._ring.write(samples)
+        while written < len(samples):
+            # Ring full: wait for the callback to drain rather than drop speech
+            if not self._running or stream is not self._out_stream or not stream.active:
+                return
+            time.sleep(PLAYBACK_BLOCK / self._out_rate)
+            written += self._ring.write(samples[written:])
 
-    def _playback_loop(self):
-        """Blocking loop that plays queued audio through speakers."""
-        # Query the output device's native sample rate
-        dev_info = sd.query_devices(self.output_device)
-        native_rate = int(dev_info["default_samplerate"])
-        print(f"[garvis] Speaker open: resampling to {native_rate}Hz")
+    def _open_output(self) -> sd.OutputStream | None:
+        """Open one output stream for the whole session, fed from the ring buffer."""
         try:
-            while self._running:
-                try:
-                    pcm = self._audio_queue.get(timeout=0.5)
-                except queue.Empty:
-                    continue
-                if not pcm:
-                    continue
-                samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
-                # Resample from SAMPLE_RATE_OUT to native device rate
-                if native_rate != SAMPLE_RATE_OUT:
-                    n_out = int(len(samples) * native_rate / SAMPLE_RATE_OUT)
-                    samples = np.interp(
-                        np.linspace(0, len(samples), n_out, endpoint=False),
-                        np.arange(len(samples)),
-                        samples,
-                    )
-                out = samples.astype(np.int16).reshape(-1, 1)
-                try:
-                    self._playing = True
-                    sd.play(out, samplerate=native_rate,
-                            device=self.output_device, blocking=True)
-                except Exception as e:
-                    print(f"[garvis] Playback error: {e}")
-                finally:
-                    # Check if more audio is queued; only clear _playing when queue drains
-                    if self._audio_queue.empty():
-                        self._playing = False
-                        self._play_end_time = time.monotonic()
+            dev_info = sd.query_devices(self.output_device)
+            self._out_rate = int(dev_info["default_samplerate"])
+            # The previous session's stream is closed, so nothing reads the ring now
+            self._ring.drop()
+            stream = sd.OutputStream(
+                samplerate=self._out_rate,
+                channels=CHANNELS,
+                dtype="int16",
+                blocksize=PLAYBACK_BLOCK,
+                device=self.output_device,
+                callback=self._audio_cb,
+            )
+            stream.start()
         except Exception as e:
-            print(f"[garvis] Playback thread error: {e}")
+            print(f"[garvis] Speaker error: {e}")
+            return None
+        self._out_stream = stream
+        print(f"[garvis] Speaker open: {self._out_rate}Hz")
+        return stream
+
+    def _audio_cb(self, outdata, frames, time_info, status):
+        """Output callback: drain the ring, zero-fill on underrun."""
+        n = self._ring.read_into(outdata[:, 0])
+        outdata[n:] = 0
+        if n and not self._ring.available():
+            self._play_end_time = time.monotonic()
 
     async def _mic_capture(self, ws):
         """Capture mic audio at device native rate, resample to 16kHz, send to WebSocket."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        mic_q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=MIC_QUEUE_CHUNKS)
 
         # Use the device's default sample rate (many USB mics only support 44.1/48kHz)
         dev_info = sd.query_devices(self.input_device)
@@ -424,16 +615,29 @@ class GarvisClient:
                 return
             if self._play_end_time and (time.monotonic() - self._play_end_time) < 1.5:
                 return
-            # Resample from native rate down to 16kHz
-            samples = indata[:, 0].astype(np.float32)
-            n_out = int(len(samples) / ratio)
-            resampled = np.interp(
-                np.linspace(0, len(samples), n_out, endpoint=False),
-                np.arange(len(samples)),
-                samples,
-            ).astype(np.int16)
-            asyncio.run_coroutine_threadsafe(ws.send(resampled.tobytes()), loop)
-
+            # Resample from native rate down to 16kHz (positions cached per block size)
+            if native_rate == SAMPLE_RATE_IN:
+                pcm = indata.tobytes()
+            else:
+                pcm = _resample(indata[:, 0], int(frames / ratio)).astype(np.int16).tobytes()
+            loop.call_soon_threadsafe(enqueue, pcm)
+
+        def enqueue(pcm: bytes):
+            if send_task.done():
+                return  # Nothing is draining the queue any more
+            if mic_q.full():
+                mic_q.get_nowait()  # Drop the oldest chunk rather than grow without bound
+            mic_q.put_nowait(pcm)
+
+        async def sender():
+            while True:
+                chunks = [await mic_q.get()]
+                # Coalesce whatever queued up while the last send was in flight
+                while not mic_q.empty():
+                    chunks.append(mic_q.get_nowait())
+                await ws.send(b"".join(chunks))
+
+        send_task = asyncio.create_task(sender())
         try:
             with sd.InputStream(
                 samplerate=native_rate,
@@ -444,13 +648,22 @@ class GarvisClient:
                 callback=callback,
             ):
                 print(f"[garvis] Mic open: {native_rate}Hz -> {SAMPLE_RATE_IN}Hz")
-                while self._running:
+                while self._running and not send_task.done():
                     await asyncio.sleep(0.1)
         except Exception as e:
             print(f"[garvis] Mic error: {e}")
+        finally:
+            send_task.cancel()
+            try:
+                await send_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                print(f"[garvis] Mic send error: {e}")
 
     def stop(self):
         self._running = False
+        self._decoder_pool.shutdown(wait=False, cancel_futures=True)
 
 
 def _start_client_thread(cfg: dict, state: dict) -> GarvisClient:
@@ -463,7 +676,7 @@ def _start_client_thread(cfg: dict, state: dict) -> GarvisClient:
     )
 
     def run_loop():
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         loop.run_until_complete(client.run())
 
@@ -482,30 +695,30 @@ def _draw_eye_closed(canvas: Canvas, cx: int, cy: int, color):
         canvas.set(x, cy, color)
 
 
-def _draw_eye_open(canvas: Canvas, cx: int, cy: int, color, t: float):
-    """Draw an open eye: small circle outline."""
-    r = 4
-    # Simple circle approximation for small radius
-    for angle_i in range(32):
-        a = angle_i * (2 * math.pi / 32)
-        x = cx + round(r * math.cos(a))
-        y = cy + round(r * math.sin(a))
-        canvas.set(x, y, color)
-    # Pupil
-    canvas.set(cx, cy, color)
-    canvas.set(cx + 1, cy, color)
-    canvas.set(cx, cy + 1, color)
-    canvas.set(cx + 1, cy + 1, color)
+# Eye outline: radius-4 circle sampled at 32 angles, deduplicated to pixel offsets
+_EYE_CIRCLE_OFFSETS = tuple(dict.fromkeys(
+    (round(4 * math.cos(a)), round(4 * math.sin(a)))
+    for a in (i * (2 * math.pi / 32) for i in range(32))
+))
+_EYE_PUPIL_OFFSETS = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+
+def _draw_eye_open(canvas: Canvas, cx: int, cy: int, color):
+    """Draw an open eye: small circle outline with a 2x2 pupil."""
+    for dx, dy in _EYE_CIRCLE_OFFSETS:
+        canvas.set(cx + dx, cy + dy, color)
+    for dx, dy in _EYE_PUPIL_OFFSETS:
+        canvas.set(cx + dx, cy + dy, color)
 
 
 def _draw_eye_blink(canvas: Canvas, cx: int, cy: int, color, phase: float):
     """Draw eye in mid-blink (arc)."""
     if phase < 0.3:
-        _draw_eye_open(canvas, cx, cy, color, 0)
+        _draw_eye_open(canvas, cx, cy, color)
     elif phase < 0.7:
         _draw_eye_closed(canvas, cx, cy, color)
     else:
-        _draw_eye_open(canvas, cx, cy, color, 0)
+        _draw_eye_open(canvas, cx, cy, color)
 
 
 def _draw_mouth(canvas: Canvas, t: float, color):
@@ -545,13 +758,13 @@ def _draw_face(canvas: Canvas, status: str, t: float):
         # Open eyes, subtle pulse
         pulse = 0.8 + 0.2 * math.sin(t * 4)
         c = (0, int(80 * pulse), int(90 * pulse))
-        _draw_eye_open(canvas, LEFT_EYE_X, EYE_Y, c, t)
-        _draw_eye_open(canvas, RIGHT_EYE_X, EYE_Y, c, t)
+        _draw_eye_open(canvas, LEFT_EYE_X, EYE_Y, c)
+        _draw_eye_open(canvas, RIGHT_EYE_X, EYE_Y, c)
 
     elif status == "speaking":
         # Open eyes + animated mouth
-        _draw_eye_open(canvas, LEFT_EYE_X, EYE_Y, EYE_COLOR, t)
-        _draw_eye_open(canvas, RIGHT_EYE_X, EYE_Y, EYE_COLOR, t)
+        _draw_eye_open(canvas, LEFT_EYE_X, EYE_Y, EYE_COLOR)
+        _draw_eye_open(canvas, RIGHT_EYE_X, EYE_Y, EYE_COLOR)
         _draw_mouth(canvas, t, MOUTH_COLOR)
 
 
@@ -559,22 +772,26 @@ def _draw_face(canvas: Canvas, status: str, t: float):
 # Caption drawing
 # ---------------------------------------------------------------------------
 
-def _word_wrap(text: str, width: int) -> list[str]:
-    """Wrap text to fit within `width` characters per line."""
-    words = text.split()
+@functools.lru_cache(maxsize=4)
+def _word_wrap(text: str, width: int) -> tuple[str, ...]:
+    """Wrap text to fit within `width` characters per line.
+
+    Cached because the caption is re-wrapped every frame but only changes
+    when a new transcript arrives.
+    """
     lines = []
-    current = ""
-    for word in words:
-        if not current:
-            current = word
-        elif len(current) + 1 + len(word) <= width:
-            current += " " + word
-        else:
-            lines.append(current)
-            current = word
-    if current:
-        lines.append(current)
-    return lines if lines else [""]
+    line = []
+    col = -1  # length of the joined line so far
+    for word in text.split():
+        if line and col + 1 + len(word) > width:
+            lines.append(" ".join(line))
+            line = []
+            col = -1
+        line.append(word)
+        col += 1 + len(word)
+    if line:
+        lines.append(" ".join(line))
+    return tuple(lines) if lines else ("",)
 
 
 def _draw_captions(canvas: Canvas, text: str, t: float):
@@ -589,22 +806,24 @@ def _draw_captions(canvas: Canvas, text: str, t: float):
 
     for i, line in enumerate(visible):
         y = CAPTION_TOP + i * CAPTION_LINE_H
-        canvas.text(CAPTION_X, y, line, CAPTION_COLOR)
+        canvas.text_cached(CAPTION_X, y, line, CAPTION_COLOR)
 
 
 # ---------------------------------------------------------------------------
 # Status indicator
 # ---------------------------------------------------------------------------
 
+_STATUS_COLORS = {
+    "connecting": STATUS_CONNECTING,
+    "idle": STATUS_IDLE,
+    "listening": STATUS_LISTENING,
+    "speaking": STATUS_SPEAKING,
+}
+
+
 def _draw_status_dot(canvas: Canvas, status: str, t: float):
     """Small status dot in bottom-left corner."""
-    colors = {
-        "connecting": STATUS_CONNECTING,
-        "idle": STATUS_IDLE,
-        "listening": STATUS_LISTENING,
-        "speaking": STATUS_SPEAKING,
-    }
-    base = colors.get(status, DIM_GRAY)
+    base = _STATUS_COLORS.get(status, DIM_GRAY)
     pulse = 0.5 + 0.5 * abs(math.sin(t * 2))
     c = (int(base[0] * pulse), int(base[1] * pulse), int(base[2] * pulse))
     canvas.set(1, 62, c)
@@ -647,9 +866,12 @@ def main():
 
     # Display loop
     canvas = Canvas()
+    background = Canvas()
+    background.line(0, 32, 63, 32, SEP_COLOR)
     sim = Simulator(canvas, title="Garvis")
     sender = Sender()
     btn_sock = _create_button_listener()
+    btn_buf = bytearray(16)  # Reused receive buffer for button packets
 
     start = time.monotonic()
 
@@ -661,16 +883,12 @@ def main():
             if btn_sock is not None:
                 try:
                     while True:
-                        btn_sock.recvfrom(16)
+                        btn_sock.recv_into(btn_buf)
                 except BlockingIOError:
                     pass
 
-            # Render
-            canvas.clear()
-
-            # Separator line
-            for x in range(64):
-                canvas.set(x, 32, SEP_COLOR)
+            # Render: clear + separator line in one buffer copy
+            canvas.blit(background)
 
             # Face (top half)
             _draw_face(canvas, state["status"], t)
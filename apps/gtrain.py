@@ -1,5 +1,6 @@
 """G Train arrivals at Greenpoint Ave - real-time MTA data."""
 
+import bisect
 import math
 import time
 import threading
@@ -11,6 +12,8 @@ from ledmatrix import Canvas, run
 # --- Config ---
 STOP_ID = "G26"
 REFRESH_SEC = 30
+NORTH_STOP = f"{STOP_ID}N"
+SOUTH_STOP = f"{STOP_ID}S"
 
 # --- Colors (dimmed for LED matrix) ---
 G_GREEN = (35, 60, 22)
@@ -23,32 +26,48 @@ AMBER = (100, 75, 0)
 
 # --- Shared state ---
 arrivals = {"north": [], "south": [], "updated": 0.0}
+_wake = threading.Event()  # set to end the current wait early
+_stop = threading.Event()
 
 
 def fetch_loop():
     """Background thread: poll MTA feed every REFRESH_SEC seconds."""
-    while True:
+    feed = None
+    while not _stop.is_set():
         try:
-            feed = NYCTFeed("G", "")  # api_key arg required by library but MTA no longer enforces keys
+            if feed is None:
+                feed = NYCTFeed("G", "")  # api_key arg required by library but MTA no longer enforces keys
+            else:
+                feed.refresh()
             now = datetime.now()
             north = []
             south = []
+            targets = {NORTH_STOP: north, SOUTH_STOP: south}
             for trip in feed.trips:
                 for stu in trip.stop_time_updates:
-                    if stu.stop_id == f"{STOP_ID}N":
+                    bucket = targets.get(stu.stop_id)
+                    if bucket is not None:
                         mins = (stu.arrival - now).total_seconds() / 60
                         if mins >= 0:
-                            north.append(int(mins))
-                    elif stu.stop_id == f"{STOP_ID}S":
-                        mins = (stu.arrival - now).total_seconds() / 60
-                        if mins >= 0:
-                            south.append(int(mins))
-            arrivals["north"] = sorted(north)[:3]
-            arrivals["south"] = sorted(south)[:3]
+                            bisect.insort(bucket, int(mins))
+            arrivals["north"] = north[:3]
+            arrivals["south"] = south[:3]
             arrivals["updated"] = time.monotonic()
         except Exception as e:
             print(f"[gtrain] fetch error: {e}")
-        time.sleep(REFRESH_SEC)
+        _wake.wait(REFRESH_SEC)
+        _wake.clear()
+
+
+def force_refresh() -> None:
+    """Re-fetch arrivals now instead of waiting out REFRESH_SEC."""
+    _wake.set()
+
+
+def stop() -> None:
+    """Stop the background fetcher after its current pass."""
+    _stop.set()
+    _wake.set()
 
 
 def draw_arrivals(canvas: Canvas, y_next: int, y_later: int, times: list, t: float):
@@ -68,9 +87,8 @@ def draw_arrivals(canvas: Canvas, y_next: int, y_later: int, times: list, t: flo
         canvas.text(2, y_later, later, MED_GREEN)
 
 
-def render(canvas: Canvas, t: float, frame: int) -> None:
-    canvas.clear()
-
+def draw_chrome(canvas: Canvas) -> None:
+    """Draw the static parts of the board: bullet, station name, dividers, labels."""
     # G bullet icon
     canvas.circle(31, 6, 5, G_GREEN, filled=True)
     canvas.text(30, 4, "G", WHITE)
@@ -83,13 +101,23 @@ def render(canvas: Canvas, t: float, frame: int) -> None:
 
     # Northbound (Court Sq)
     canvas.text(1, 23, "CT SQ", DIM_GRAY)
-    draw_arrivals(canvas, 29, 35, arrivals["north"], t)
 
     # Divider
     canvas.line(2, 41, 61, 41, DIVIDER)
 
     # Southbound (Church Av)
     canvas.text(1, 44, "CHURCH AV", DIM_GRAY)
+
+
+# Static chrome, drawn once and copied under each frame
+_BG = Canvas()
+draw_chrome(_BG)
+
+
+def render(canvas: Canvas, t: float, frame: int) -> None:
+    canvas.blit(_BG)
+
+    draw_arrivals(canvas, 29, 35, arrivals["north"], t)
     draw_arrivals(canvas, 50, 56, arrivals["south"], t)
 
     # Status dot
@@ -106,4 +134,7 @@ def render(canvas: Canvas, t: float, frame: int) -> None:
 threading.Thread(target=fetch_loop, daemon=True).start()
 
 if __name__ == "__main__":
-    run(render, fps=10, title="G Train - Greenpoint Av")
+    try:
+        run(render, fps=10, title="G Train - Greenpoint Av")
+    finally:
+        stop()
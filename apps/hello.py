@@ -14,8 +14,8 @@ def render(canvas: Canvas, t: float, frame: int) -> None:
     # Bouncing "HELLO" text
     x = int(20 + math.sin(t * 1.5) * 10)
     y = int(28 + math.sin(t * 2.3) * 8)
-    hue = (t * 50) % 360
-    canvas.text(x, y, "HELLO", canvas.hsv(hue))
+    hue = int(t * 50) % 360
+    canvas.text(x, y, "HELLO", canvas.hsv_lut()[hue])
 
     # Frame counter in corner
     canvas.text(1, 1, str(frame % 1000), (80, 80, 80))
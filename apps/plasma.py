@@ -1,21 +1,28 @@
 """Plasma effect - classic demoscene sine-based color plasma."""
 
-import math
+import numpy as np
 from ledmatrix import Canvas, run
 
+# Sine arguments, computed once. The x, y and x+y waves only vary along one
+# axis, so they are evaluated on short vectors and broadcast; only the radial
+# wave needs the full 64x64 grid.
+_Y, _X = np.mgrid[0:64, 0:64]
+_AXIS = np.arange(64) * 0.1                # x * 0.1 (or y * 0.1)
+_DIAG = np.arange(127) * 0.1               # (x + y) * 0.1
+_DIAG_IDX = _X + _Y
+_RP = np.sqrt(_X * _X + _Y * _Y) * 0.1
+
 
 def render(canvas: Canvas, t: float, frame: int) -> None:
-    for y in range(canvas.height):
-        for x in range(canvas.width):
-            # Classic plasma formula with multiple sine waves
-            v1 = math.sin(x * 0.1 + t)
-            v2 = math.sin(y * 0.1 + t * 0.7)
-            v3 = math.sin((x + y) * 0.1 + t * 0.5)
-            v4 = math.sin(math.sqrt(x * x + y * y) * 0.1 + t * 1.3)
+    # Classic plasma formula with multiple sine waves, over the whole grid at once
+    v1 = np.sin(_AXIS + t)                         # along x
+    v2 = np.sin(_AXIS + t * 0.7)[:, np.newaxis]    # along y
+    v3 = np.sin(_DIAG + t * 0.5)[_DIAG_IDX]        # along x + y
+    v4 = np.sin(_RP + t * 1.3)
 
-            v = (v1 + v2 + v3 + v4) / 4.0  # -1 to 1
-            hue = (v * 180 + t * 30) % 360
-            canvas.set(x, y, canvas.hsv(hue, 0.9, 0.7))
+    v = (v1 + v2 + v3 + v4) / 4.0  # -1 to 1
+    hue = (v * 180 + t * 30).astype(np.intp) % 360
+    canvas.blit(canvas.hsv_lut(0.9, 0.7)[hue])
 
 
 if __name__ == "__main__":
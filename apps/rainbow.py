@@ -1,13 +1,15 @@
 """Rainbow wave demo - scrolling diagonal rainbow pattern."""
 
+import numpy as np
 from ledmatrix import Canvas, run
 
+# Diagonal hue offset per pixel, computed once for the 64x64 grid
+_XY = np.add.outer(np.arange(64), np.arange(64)) * 2.8
+
 
 def render(canvas: Canvas, t: float, frame: int) -> None:
-    for y in range(canvas.height):
-        for x in range(canvas.width):
-            hue = ((x + y) * 2.8 + t * 60) % 360
-            canvas.set(x, y, canvas.hsv(hue, 1.0, 0.8))
+    hue = (_XY + t * 60).astype(np.intp) % 360
+    canvas.blit(canvas.hsv_lut(1.0, 0.8)[hue])
 
 
 if __name__ == "__main__":
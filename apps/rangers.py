@@ -1,15 +1,20 @@
 """NY Rangers game tracker - live scores and upcoming games via ESPN API."""
 
+import concurrent.futures
 import io
-import json
 import math
+import socket
 import time
 import threading
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+import orjson
+import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from ledmatrix import Canvas, run
 
 # --- Sport / Team Config (change these for other ESPN-supported teams) ---
@@ -20,6 +25,7 @@ TEAM_ABBR = "NYR"           # Used to identify our team in scoreboard results
 TEAM_NAME = "NY RANGERS"    # Display name for no-game screen
 POLL_NORMAL = 60             # Seconds between polls (no live game)
 POLL_LIVE = 15               # Seconds between polls (live game)
+TEAM_REFRESH_LIVE = 600      # Seconds to reuse the team payload during a game
 LOGO_SIZE = 22               # Logo resize target (square)
 
 # --- ESPN API URLs ---
@@ -51,7 +57,7 @@ game_data = {
     "away_abbr": "",
     "home_score": "",
     "away_score": "",
-    "home_logo": None,      # list of (x, y, r, g, b) tuples
+    "home_logo": None,      # (rgb, mask) arrays: (22, 22, 3) uint8 + (22, 22) bool
     "away_logo": None,
     "detail": "",           # ESPN shortDetail or custom formatted string
     "game_date": "",        # "FEB 27"
@@ -64,53 +70,78 @@ game_data = {
     "updated": 0.0,
 }
 
-_logo_cache: dict[str, list[tuple[int, int, int, int, int]]] = {}
+Logo = tuple[np.ndarray, np.ndarray]  # (rgb, mask)
+
+_logo_cache: dict[str, Logo] = {}
 _cache_dir = Path(__file__).parent / ".logo_cache"
+_BLACK_RGBA = Image.new("RGBA", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0, 255))  # Logo backdrop
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets keep urllib3's TCP_NODELAY and add SO_KEEPALIVE."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# One keep-alive session so polls reuse the TCP/TLS connection to ESPN.
+# POLL_NORMAL stays under the usual 75s server keep-alive window.
+_http = requests.Session()
+_http.headers["User-Agent"] = "LedMatrix/1.0"
+_http.mount("https://", _KeepAliveAdapter(pool_connections=4, pool_maxsize=4))
+_refresh = threading.Event()  # set to cut the current poll wait short
+_validators: dict[str, tuple[dict, dict]] = {}  # url -> (conditional headers, last payload)
 
 
 # ---------------------------------------------------------------------------
 # Logo pipeline
 # ---------------------------------------------------------------------------
 
-def _download_logo(url: str, abbr: str) -> list[tuple[int, int, int, int, int]]:
-    """Download a logo PNG, resize, composite on black, return pixel list."""
+def _download_logo(url: str, abbr: str) -> Logo:
+    """Download a logo PNG, resize, composite on black, return (rgb, mask) arrays."""
     _cache_dir.mkdir(exist_ok=True)
     cache_file = _cache_dir / f"{LEAGUE}_{abbr.lower()}_{LOGO_SIZE}.png"
+    array_file = cache_file.with_suffix(".npz")
+
+    # Warm start: the processed arrays skip Pillow entirely
+    if array_file.exists():
+        try:
+            with np.load(array_file) as data:
+                return data["rgb"], data["mask"]
+        except Exception:
+            pass  # Unreadable; rebuild from the PNG
 
     if cache_file.exists():
         img = Image.open(cache_file).convert("RGB")
     else:
-        req = urllib.request.Request(url, headers={"User-Agent": "LedMatrix/1.0"})
-        raw = urllib.request.urlopen(req, timeout=10).read()
-        img = Image.open(io.BytesIO(raw)).convert("RGBA")
-        img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+        resp = _http.get(url, timeout=10)
+        resp.raise_for_status()
+        img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
+        img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.BILINEAR)
         # Composite onto black background
-        bg = Image.new("RGBA", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0, 255))
-        bg.paste(img, (0, 0), img)
-        img = bg.convert("RGB")
+        img = Image.alpha_composite(_BLACK_RGBA, img).convert("RGB")
         img.save(cache_file)
 
-    pixels = []
-    for y in range(img.height):
-        for x in range(img.width):
-            r, g, b = img.getpixel((x, y))
-            # Dim slightly for LED matrix
-            r, g, b = int(r * 0.5), int(g * 0.5), int(b * 0.5)
-            if r > 2 or g > 2 or b > 2:
-                pixels.append((x, y, r, g, b))
-    return pixels
+    # Dim slightly for LED matrix; near-black pixels are left transparent
+    rgb = np.asarray(img, dtype=np.uint8) >> 1
+    mask = rgb.max(axis=2) > 2
+    np.savez(array_file, rgb=rgb, mask=mask)
+    return rgb, mask
 
 
-def _get_logo(abbr: str, logo_url: str | None) -> list | None:
+def _get_logo(abbr: str, logo_url: str | None) -> Logo | None:
     """Get cached logo pixels, downloading if needed."""
     if abbr in _logo_cache:
         return _logo_cache[abbr]
     if not logo_url:
         return None
     try:
-        pixels = _download_logo(logo_url, abbr)
-        _logo_cache[abbr] = pixels
-        return pixels
+        logo = _download_logo(logo_url, abbr)
+        _logo_cache[abbr] = logo
+        return logo
     except Exception as e:
         print(f"[rangers] Logo download failed for {abbr}: {e}")
         return None
@@ -133,9 +164,39 @@ def _get_team_logo_url(team: dict) -> str | None:
 # ---------------------------------------------------------------------------
 
 def _fetch_json(url: str) -> dict:
-    req = urllib.request.Request(url, headers={"User-Agent": "LedMatrix/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read())
+    """GET and parse JSON, revalidating with ETag/Last-Modified when ESPN sent them."""
+    cached = _validators.get(url)
+    resp = _http.get(url, timeout=15, headers=cached[0] if cached else None)
+    if resp.status_code == 304 and cached:
+        return cached[1]  # Unchanged: skip the download and the parse
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    conditional = {}
+    if "ETag" in resp.headers:
+        conditional["If-None-Match"] = resp.headers["ETag"]
+    if "Last-Modified" in resp.headers:
+        conditional["If-Modified-Since"] = resp.headers["Last-Modified"]
+    if conditional:
+        _validators[url] = (conditional, data)
+    return data
+
+
+def _fetch_json_async(url: str) -> concurrent.futures.Future:
+    """Start _fetch_json(url) on a daemon thread, so the request can overlap others.
+
+    A daemon thread (not an executor worker) never holds up interpreter exit
+    while a request is in flight.
+    """
+    future = concurrent.futures.Future()
+
+    def fetch():
+        try:
+            future.set_result(_fetch_json(url))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=fetch, daemon=True).start()
+    return future
 
 
 def _format_game_time(iso_date: str) -> tuple[str, str]:
@@ -173,6 +234,12 @@ def _ensure_logos(competitors: list) -> None:
 # Data fetching thread
 # ---------------------------------------------------------------------------
 
+def _publish(gd: dict) -> None:
+    """Swap in a new game_data snapshot so render never sees a half-applied update."""
+    global game_data
+    game_data = gd
+
+
 def _fetch_loop():
     # First, always fetch our own team logo for the no-game screen
     try:
@@ -180,22 +247,38 @@ def _fetch_loop():
         team_info = data.get("team", {})
         our_url = _get_team_logo_url(team_info)
         if our_url:
-            game_data["our_logo"] = _get_logo(TEAM_ABBR, our_url)
+            _publish({**game_data, "our_logo": _get_logo(TEAM_ABBR, our_url)})
     except Exception as e:
         print(f"[rangers] Initial team fetch failed: {e}")
 
+    team_data = None
+    team_fetched = 0.0
     while True:
         poll = POLL_NORMAL
+        # Build the next snapshot privately; render keeps the old one until _publish
+        gd = dict(game_data)
+        in_game = gd["state"] in ("in", "post")
+        # During a game, start the scoreboard fetch alongside the team fetch
+        sb_future = None
+        if in_game:
+            sb_future = _fetch_json_async(SCOREBOARD_URL)
         try:
-            # 1. Fetch team data for nextEvent
-            data = _fetch_json(TEAM_URL)
+            # 1. Fetch team data for nextEvent. It changes at most daily, so during
+            #    a game the cached payload is reused and only the scoreboard is polled.
+            now = time.monotonic()
+            if team_data is None or not in_game or now - team_fetched > TEAM_REFRESH_LIVE:
+                team_data = _fetch_json(TEAM_URL)
+                team_fetched = now
+            data = team_data
             team_info = data.get("team", {})
             next_events = team_info.get("nextEvent", [])
 
             if not next_events:
-                game_data["state"] = "none"
-                game_data["updated"] = time.monotonic()
-                time.sleep(poll)
+                gd["state"] = "none"
+                gd["updated"] = time.monotonic()
+                _publish(gd)
+                _refresh.wait(poll)
+                _refresh.clear()
                 continue
 
             event = next_events[0]
@@ -224,24 +307,24 @@ def _fetch_loop():
             home_abbr = home_team.get("abbreviation", "")
             away_abbr = away_team.get("abbreviation", "")
 
-            game_data["home_abbr"] = home_abbr
-            game_data["away_abbr"] = away_abbr
-            game_data["home_logo"] = _logo_cache.get(home_abbr)
-            game_data["away_logo"] = _logo_cache.get(away_abbr)
+            gd["home_abbr"] = home_abbr
+            gd["away_abbr"] = away_abbr
+            gd["home_logo"] = _logo_cache.get(home_abbr)
+            gd["away_logo"] = _logo_cache.get(away_abbr)
 
             if state == "pre":
                 # Upcoming game
                 game_date, game_time = _format_game_time(event.get("date", ""))
-                game_data["game_date"] = game_date
-                game_data["game_time"] = game_time
-                game_data["detail"] = status_type.get("shortDetail", "")
-                game_data["state"] = "pre"
-                game_data["updated"] = time.monotonic()
+                gd["game_date"] = game_date
+                gd["game_time"] = game_time
+                gd["detail"] = status_type.get("shortDetail", "")
+                gd["state"] = "pre"
+                gd["updated"] = time.monotonic()
 
             elif state in ("in", "post"):
                 # Live or final - fetch scoreboard for real-time scores
                 try:
-                    sb = _fetch_json(SCOREBOARD_URL)
+                    sb = sb_future.result() if sb_future else _fetch_json(SCOREBOARD_URL)
                     for ev in sb.get("events", []):
                         comp = ev.get("competitions", [{}])[0]
                         comps = comp.get("competitors", [])
@@ -255,59 +338,67 @@ def _fetch_loop():
                                 if a and url:
                                     _get_logo(a, url)
                                 if c.get("homeAway") == "home":
-                                    game_data["home_abbr"] = a
-                                    game_data["home_score"] = c.get("score", "0")
-                                    game_data["home_logo"] = _logo_cache.get(a)
+                                    gd["home_abbr"] = a
+                                    gd["home_score"] = c.get("score", "0")
+                                    gd["home_logo"] = _logo_cache.get(a)
                                 else:
-                                    game_data["away_abbr"] = a
-                                    game_data["away_score"] = c.get("score", "0")
-                                    game_data["away_logo"] = _logo_cache.get(a)
+                                    gd["away_abbr"] = a
+                                    gd["away_score"] = c.get("score", "0")
+                                    gd["away_logo"] = _logo_cache.get(a)
 
                             sb_status = comp.get("status", {})
                             sb_type = sb_status.get("type", {})
                             period = sb_status.get("period", 0)
-                            game_data["period"] = period
-                            game_data["clock"] = sb_status.get("displayClock", "")
-                            game_data["period_text"] = _period_text(period)
-                            game_data["status_detail"] = sb_type.get("detail", "")
-                            game_data["detail"] = sb_type.get("shortDetail", "")
-                            game_data["state"] = sb_type.get("state", state)
+                            gd["period"] = period
+                            gd["clock"] = sb_status.get("displayClock", "")
+                            gd["period_text"] = _period_text(period)
+                            gd["status_detail"] = sb_type.get("detail", "")
+                            gd["detail"] = sb_type.get("shortDetail", "")
+                            gd["state"] = sb_type.get("state", state)
                             break
                     else:
                         # Game not on scoreboard yet, use team endpoint data
-                        game_data["home_score"] = home_comp.get("score", "0")
-                        game_data["away_score"] = away_comp.get("score", "0")
-                        game_data["state"] = state
+                        gd["home_score"] = home_comp.get("score", "0")
+                        gd["away_score"] = away_comp.get("score", "0")
+                        gd["state"] = state
                 except Exception:
                     # Scoreboard fetch failed, use what we have from team endpoint
-                    game_data["state"] = state
+                    gd["state"] = state
 
-                game_data["updated"] = time.monotonic()
-                if state == "in":
+                gd["updated"] = time.monotonic()
+                # Scoreboard state wins: the cached team payload can lag the final horn
+                if gd["state"] == "in":
                     poll = POLL_LIVE
 
         except Exception as e:
             print(f"[rangers] Fetch error: {e}")
 
-        time.sleep(poll)
+        _publish(gd)
+        _refresh.wait(poll)
+        _refresh.clear()
+
+
+def force_refresh() -> None:
+    """Poll ESPN now instead of waiting out the current interval."""
+    _refresh.set()
 
 
 # ---------------------------------------------------------------------------
 # Drawing helpers
 # ---------------------------------------------------------------------------
 
-def _draw_logo(canvas: Canvas, pixels: list | None, ox: int, oy: int) -> None:
-    if pixels is None:
+def _draw_logo(canvas: Canvas, logo: Logo | None, ox: int, oy: int) -> None:
+    if logo is None:
         return
-    for x, y, r, g, b in pixels:
-        canvas.set(ox + x, oy + y, (r, g, b))
+    rgb, mask = logo
+    canvas.blit(rgb, ox, oy, mask=mask)
 
 
 def _centered_text(canvas: Canvas, y: int, text: str, color,
                    x_min: int = 0, x_max: int = 63) -> None:
     w = len(text) * 4 - 1
     x = x_min + ((x_max - x_min + 1) - w) // 2
-    canvas.text(max(0, x), y, text, color)
+    canvas.text_cached(max(0, x), y, text, color)
 
 
 def _abbr_centered_under_logo(canvas: Canvas, abbr: str, logo_x: int, y: int,
@@ -315,23 +406,33 @@ def _abbr_centered_under_logo(canvas: Canvas, abbr: str, logo_x: int, y: int,
     """Center abbreviation text under a logo."""
     w = len(abbr) * 4 - 1
     x = logo_x + (LOGO_SIZE - w) // 2
-    canvas.text(max(0, x), y, abbr, color)
+    canvas.text_cached(max(0, x), y, abbr, color)
 
 
 def _draw_divider(canvas: Canvas, y: int) -> None:
     canvas.line(2, y, 61, y, DIVIDER_COLOR)
 
 
-def _draw_status_dot(canvas: Canvas, t: float) -> None:
-    age = t - game_data["updated"] if game_data["updated"] else 999
-    if game_data["state"] == "loading":
-        b = int(40 + 40 * abs(math.sin(t * 2)))
+# abs(sin) over one of its periods (pi), sampled for the pulsing indicators
+_PULSE_STEPS = 256
+_PULSE_LUT = [abs(math.sin(math.pi * i / _PULSE_STEPS)) for i in range(_PULSE_STEPS)]
+
+
+def _pulse(t: float, speed: float) -> float:
+    """abs(math.sin(t * speed)) from the lookup table."""
+    return _PULSE_LUT[int(t * speed * (_PULSE_STEPS / math.pi)) % _PULSE_STEPS]
+
+
+def _draw_status_dot(canvas: Canvas, gd: dict, t: float) -> None:
+    age = t - gd["updated"] if gd["updated"] else 999
+    if gd["state"] == "loading":
+        b = int(40 + 40 * _pulse(t, 2))
         canvas.set(1, 62, (b, b, 0))
     elif age < 120:
-        b = int(30 + 30 * abs(math.sin(t * 2)))
+        b = int(30 + 30 * _pulse(t, 2))
         canvas.set(1, 62, (0, b, 0))
     else:
-        b = int(40 + 40 * abs(math.sin(t * 2)))
+        b = int(40 + 40 * _pulse(t, 2))
         canvas.set(1, 62, (b, b // 2, 0))
 
 
@@ -344,17 +445,19 @@ def _abbr_color(abbr: str) -> tuple[int, int, int]:
 # Display modes
 # ---------------------------------------------------------------------------
 
-def _draw_loading(canvas: Canvas, t: float) -> None:
+def _draw_loading(canvas: Canvas, gd: dict) -> None:
     _centered_text(canvas, 28, "LOADING", DIM_GRAY)
-    # Animated dots
+
+
+def _draw_loading_dots(canvas: Canvas, t: float) -> None:
     dots = "." * (int(t * 2) % 4)
     _centered_text(canvas, 35, dots, DIM_GRAY)
 
 
-def _draw_no_game(canvas: Canvas, t: float) -> None:
+def _draw_no_game(canvas: Canvas, gd: dict) -> None:
     # Centered team logo
-    logo = game_data["our_logo"]
-    if logo:
+    logo = gd["our_logo"]
+    if logo is not None:
         cx = (64 - LOGO_SIZE) // 2
         _draw_logo(canvas, logo, cx, LOGO_Y)
 
@@ -364,75 +467,66 @@ def _draw_no_game(canvas: Canvas, t: float) -> None:
     _centered_text(canvas, 43, "SCHEDULED", DIM_GRAY)
 
 
-def _draw_pre_game(canvas: Canvas, t: float) -> None:
-    # Logos
-    _draw_logo(canvas, game_data["away_logo"], AWAY_LOGO_X, LOGO_Y)
-    _draw_logo(canvas, game_data["home_logo"], HOME_LOGO_X, LOGO_Y)
+def _draw_matchup_chrome(canvas: Canvas, gd: dict) -> tuple[str, str]:
+    """Shared top half of pre/live/final: logos, abbreviations, divider.
 
-    # VS between logos
-    _centered_text(canvas, 10, "VS", DIM_GRAY, x_min=24, x_max=39)
+    Returns (away, home) abbreviations for the caller's score lines.
+    """
+    # Logos
+    _draw_logo(canvas, gd["away_logo"], AWAY_LOGO_X, LOGO_Y)
+    _draw_logo(canvas, gd["home_logo"], HOME_LOGO_X, LOGO_Y)
 
     # Abbreviations under logos
-    away = game_data["away_abbr"]
-    home = game_data["home_abbr"]
+    away = gd["away_abbr"]
+    home = gd["home_abbr"]
     _abbr_centered_under_logo(canvas, away, AWAY_LOGO_X, ABBR_Y, _abbr_color(away))
     _abbr_centered_under_logo(canvas, home, HOME_LOGO_X, ABBR_Y, _abbr_color(home))
 
     _draw_divider(canvas, DIVIDER_Y)
+    return away, home
 
-    # Date and time
-    _centered_text(canvas, 34, game_data["game_date"], WHITE)
-    _centered_text(canvas, 41, game_data["game_time"], WHITE)
 
+def _draw_pre_game(canvas: Canvas, gd: dict) -> None:
+    _draw_matchup_chrome(canvas, gd)
 
-def _draw_live_game(canvas: Canvas, t: float) -> None:
-    # Logos
-    _draw_logo(canvas, game_data["away_logo"], AWAY_LOGO_X, LOGO_Y)
-    _draw_logo(canvas, game_data["home_logo"], HOME_LOGO_X, LOGO_Y)
+    # VS between logos
+    _centered_text(canvas, 10, "VS", DIM_GRAY, x_min=24, x_max=39)
 
-    # Pulsing dot between logos (live indicator)
-    pulse = int(50 + 50 * abs(math.sin(t * 3)))
-    canvas.set(31, 11, (pulse, 5, 5))
-    canvas.set(32, 11, (pulse, 5, 5))
+    # Date and time
+    _centered_text(canvas, 34, gd["game_date"], WHITE)
+    _centered_text(canvas, 41, gd["game_time"], WHITE)
 
-    # Abbreviations
-    away = game_data["away_abbr"]
-    home = game_data["home_abbr"]
-    _abbr_centered_under_logo(canvas, away, AWAY_LOGO_X, ABBR_Y, _abbr_color(away))
-    _abbr_centered_under_logo(canvas, home, HOME_LOGO_X, ABBR_Y, _abbr_color(home))
 
-    _draw_divider(canvas, DIVIDER_Y)
+def _draw_live_game(canvas: Canvas, gd: dict) -> None:
+    away, home = _draw_matchup_chrome(canvas, gd)
 
     # Score lines: "PHI  3" / "NYR  2"
-    away_line = f"{away:3} {game_data['away_score']:>2}"
-    home_line = f"{home:3} {game_data['home_score']:>2}"
+    away_line = f"{away:3} {gd['away_score']:>2}"
+    home_line = f"{home:3} {gd['home_score']:>2}"
     _centered_text(canvas, 34, away_line, _abbr_color(away))
     _centered_text(canvas, 41, home_line, _abbr_color(home))
 
     # Period and clock
-    period_clock = f"{game_data['period_text']} {game_data['clock']}"
+    period_clock = f"{gd['period_text']} {gd['clock']}"
     _centered_text(canvas, 49, period_clock, AMBER)
 
+
+def _draw_live_indicators(canvas: Canvas, t: float) -> None:
+    # Pulsing dot between logos (live indicator)
+    pulse = int(50 + 50 * _pulse(t, 3))
+    canvas.set(31, 11, (pulse, 5, 5))
+    canvas.set(32, 11, (pulse, 5, 5))
+
     # Blinking LIVE
     if int(t * 2) % 2:
         _centered_text(canvas, 57, "LIVE", LIVE_RED)
 
 
-def _draw_final(canvas: Canvas, t: float) -> None:
-    # Logos
-    _draw_logo(canvas, game_data["away_logo"], AWAY_LOGO_X, LOGO_Y)
-    _draw_logo(canvas, game_data["home_logo"], HOME_LOGO_X, LOGO_Y)
-
-    # Abbreviations
-    away = game_data["away_abbr"]
-    home = game_data["home_abbr"]
-    _abbr_centered_under_logo(canvas, away, AWAY_LOGO_X, ABBR_Y, _abbr_color(away))
-    _abbr_centered_under_logo(canvas, home, HOME_LOGO_X, ABBR_Y, _abbr_color(home))
-
-    _draw_divider(canvas, DIVIDER_Y)
+def _draw_final(canvas: Canvas, gd: dict) -> None:
+    away, home = _draw_matchup_chrome(canvas, gd)
 
     # Final text
-    detail = game_data.get("status_detail", "Final")
+    detail = gd.get("status_detail", "Final")
     if "OT" in detail:
         final_text = "FINAL OT"
     elif "SO" in detail:
@@ -442,8 +536,8 @@ def _draw_final(canvas: Canvas, t: float) -> None:
     _centered_text(canvas, 35, final_text, DIM_WHITE)
 
     # Score lines
-    away_line = f"{away:3} {game_data['away_score']:>2}"
-    home_line = f"{home:3} {game_data['home_score']:>2}"
+    away_line = f"{away:3} {gd['away_score']:>2}"
+    home_line = f"{home:3} {gd['home_score']:>2}"
     _centered_text(canvas, 42, away_line, _abbr_color(away))
     _centered_text(canvas, 49, home_line, _abbr_color(home))
 
@@ -452,22 +546,38 @@ def _draw_final(canvas: Canvas, t: float) -> None:
 # Main render
 # ---------------------------------------------------------------------------
 
+# state -> (static layer, animated overlay)
+_MODES = {
+    "loading": (_draw_loading, _draw_loading_dots),
+    "none": (_draw_no_game, None),
+    "pre": (_draw_pre_game, None),
+    "in": (_draw_live_game, _draw_live_indicators),
+    "post": (_draw_final, None),
+}
+
+# The static layer only changes when the fetcher publishes an update, so it is
+# drawn once per update and copied into each frame.
+_static = Canvas()
+_static_key = None
+
+
 def render(canvas: Canvas, t: float, frame: int) -> None:
-    canvas.clear()
-
-    state = game_data["state"]
-    if state == "loading":
-        _draw_loading(canvas, t)
-    elif state == "none":
-        _draw_no_game(canvas, t)
-    elif state == "pre":
-        _draw_pre_game(canvas, t)
-    elif state == "in":
-        _draw_live_game(canvas, t)
-    elif state == "post":
-        _draw_final(canvas, t)
-
-    _draw_status_dot(canvas, t)
+    global _static_key
+
+    gd = game_data  # one read: the fetcher swaps in whole snapshots
+    state = gd["state"]
+    draw_static, draw_overlay = _MODES.get(state, (None, None))
+    key = (state, gd["updated"])
+    if key != _static_key:
+        _static.clear()
+        if draw_static:
+            draw_static(_static, gd)
+        _static_key = key
+
+    canvas.blit(_static)
+    if draw_overlay:
+        draw_overlay(canvas, t)
+    _draw_status_dot(canvas, gd, t)
 
 
 # Start background fetcher
@@ -1,19 +1,25 @@
 """Multi-team sports tracker - favorite teams with button navigation."""
 
+import functools
+import heapq
 import io
 import json
 import math
 import random
+import selectors
 import socket
 import sys
 import time
 import threading
-import urllib.request
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import orjson
 import pygame
+import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
 
 from ledmatrix.canvas import Canvas
 from ledmatrix.simulator import Simulator
@@ -23,12 +29,15 @@ from ledmatrix.sender import Sender
 BUTTON_PORT = 7778
 BTN_UP_CODE = 0x01
 BTN_DOWN_CODE = 0x02
+KEY_STEPS = {pygame.K_UP: -1, pygame.K_DOWN: 1}  # Arrow key -> favorite index step
 OVERLAY_DURATION = 2.0
 AUTO_ROTATE = 60.0
 POLL_NORMAL = 60
 POLL_LIVE = 15
 MIN_FETCH_GAP = 2.0
+SCOREBOARD_TTL = 10.0
 LOGO_SIZE = 22
+LOGO_WORKERS = 8  # Concurrent logo downloads in _prewarm_logos
 ESPN_BASE = "https://site.api.espn.com/apis/site/v2/sports"
 
 # --- Layout ---
@@ -65,16 +74,26 @@ LEAGUES = [
 
 # --- Shared state ---
 all_game_data: dict[str, dict] = {}
-_logo_cache: dict[str, list] = {}
-_scoreboard_cache: dict[str, tuple[float, dict]] = {}
+Logo = tuple[np.ndarray, np.ndarray]  # (rgb, mask): (22, 22, 3) uint8 + (22, 22) bool
+
+_logo_cache: dict[str, Logo] = {}
+_logo_lock = threading.Lock()  # logos are fetched from pool threads
+_scoreboard_cache: dict[str, tuple[float, dict, bool]] = {}  # key -> (ts, team index, any live)
+_validators: dict[str, tuple[dict, dict]] = {}  # url -> (conditional headers, last payload)
 _cache_dir = Path(__file__).parent / ".logo_cache"
 _config_path = Path(__file__).parent / ".sports_favorites.json"
 
+# One keep-alive session so polls reuse TCP/TLS connections to ESPN and its logo CDN
+_http = requests.Session()
+_http.headers["User-Agent"] = "LedMatrix/1.0"
+_http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 # ---------------------------------------------------------------------------
 # Color helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_led(hex_color: str, brightness: float = 0.35) -> tuple[int, int, int]:
     """Convert ESPN hex color (e.g. '0041A8') to dimmed LED RGB tuple."""
     if not hex_color or len(hex_color) < 6:
@@ -89,34 +108,40 @@ def _hex_to_led(hex_color: str, brightness: float = 0.35) -> tuple[int, int, int
 # Logo pipeline
 # ---------------------------------------------------------------------------
 
-def _download_logo(url: str, league: str, abbr: str) -> list:
-    """Download a logo PNG, resize, composite on black, return pixel list."""
+def _download_logo(url: str, league: str, abbr: str) -> Logo:
+    """Download a logo PNG, resize, composite on black, return (rgb, mask) arrays."""
     _cache_dir.mkdir(exist_ok=True)
     cache_file = _cache_dir / f"{league}_{abbr.lower()}_{LOGO_SIZE}.png"
+    array_file = cache_file.with_suffix(".npz")
+
+    # Warm start: the processed arrays skip Pillow entirely
+    if array_file.exists():
+        try:
+            with np.load(array_file) as data:
+                return data["rgb"], data["mask"]
+        except Exception:
+            pass  # Unreadable; rebuild from the PNG
 
     if cache_file.exists():
         img = Image.open(cache_file).convert("RGB")
     else:
-        req = urllib.request.Request(url, headers={"User-Agent": "LedMatrix/1.0"})
-        raw = urllib.request.urlopen(req, timeout=10).read()
-        img = Image.open(io.BytesIO(raw)).convert("RGBA")
+        resp = _http.get(url, timeout=10)
+        resp.raise_for_status()
+        img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
         img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
         bg = Image.new("RGBA", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0, 255))
         bg.paste(img, (0, 0), img)
         img = bg.convert("RGB")
         img.save(cache_file)
 
-    pixels = []
-    for y in range(img.height):
-        for x in range(img.width):
-            r, g, b = img.getpixel((x, y))
-            r, g, b = int(r * 0.5), int(g * 0.5), int(b * 0.5)
-            if r > 2 or g > 2 or b > 2:
-                pixels.append((x, y, r, g, b))
-    return pixels
+    # Dim for LED matrix; near-black pixels are left transparent
+    rgb = np.asarray(img, dtype=np.uint8) >> 1
+    mask = rgb.max(axis=2) > 2
+    np.savez(array_file, rgb=rgb, mask=mask)
+    return rgb, mask
 
 
-def _get_logo(league: str, abbr: str, url: str | None) -> list | None:
+def _get_logo(league: str, abbr: str, url: str | None) -> Logo | None:
     """Get cached logo pixels, downloading if needed."""
     key = f"{league}_{abbr}"
     if key in _logo_cache:
@@ -124,14 +149,38 @@ def _get_logo(league: str, abbr: str, url: str | None) -> list | None:
     if not url:
         return None
     try:
-        pixels = _download_logo(url, league, abbr)
-        _logo_cache[key] = pixels
-        return pixels
+        logo = _download_logo(url, league, abbr)
+        with _logo_lock:
+            _logo_cache[key] = logo
+        return logo
     except Exception as e:
         print(f"[sports] Logo download failed for {abbr}: {e}")
         return None
 
 
+def _prewarm_logos(items) -> None:
+    """Fetch missing logos concurrently. items: (league, abbr, url) triples."""
+    missing = {(league, abbr): url for league, abbr, url in items
+               if url and f"{league}_{abbr}" not in _logo_cache}
+    todo = list(missing)
+
+    def worker():
+        while True:
+            try:
+                key = todo.pop()
+            except IndexError:
+                return
+            _get_logo(*key, missing[key])
+
+    # Daemon workers rather than an executor, so exit never waits on a download
+    threads = [threading.Thread(target=worker, daemon=True)
+               for _ in range(min(LOGO_WORKERS, len(todo)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
 def _get_team_logo_url(team: dict) -> str | None:
     """Extract logo URL from an ESPN team object (handles both formats)."""
     if "logo" in team and isinstance(team["logo"], str):
@@ -147,11 +196,24 @@ def _get_team_logo_url(team: dict) -> str | None:
 # ---------------------------------------------------------------------------
 
 def _fetch_json(url: str) -> dict:
-    req = urllib.request.Request(url, headers={"User-Agent": "LedMatrix/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read())
+    """GET and parse JSON, revalidating with ETag/Last-Modified when ESPN sent them."""
+    cached = _validators.get(url)
+    resp = _http.get(url, timeout=15, headers=cached[0] if cached else None)
+    if resp.status_code == 304 and cached:
+        return cached[1]  # Unchanged: skip the download and the parse
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    conditional = {}
+    if "ETag" in resp.headers:
+        conditional["If-None-Match"] = resp.headers["ETag"]
+    if "Last-Modified" in resp.headers:
+        conditional["If-Modified-Since"] = resp.headers["Last-Modified"]
+    if conditional:
+        _validators[url] = (conditional, data)
+    return data
 
 
+@functools.lru_cache(maxsize=256)
 def _format_game_time(iso_date: str) -> tuple[str, str]:
     """Parse ISO date -> ('FEB 27', '7:00 PM') in local timezone."""
     dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
@@ -184,18 +246,37 @@ def _period_text(period: int, sport: str = "hockey") -> str:
     return f"P{period}"
 
 
-def _fetch_scoreboard(sport: str, league: str) -> dict:
-    """Fetch scoreboard with per-league caching (10s TTL)."""
+def _index_scoreboard(scoreboard: dict) -> tuple[dict[str, dict], bool]:
+    """Map team id -> event for every competitor; also report whether any game is live."""
+    index = {}
+    any_live = False
+    for ev in scoreboard.get("events", []):
+        comp = (ev.get("competitions") or [{}])[0]
+        any_live = any_live or comp.get("status", {}).get("type", {}).get("state") == "in"
+        for c in comp.get("competitors", []):
+            team_id = c.get("team", {}).get("id")
+            if team_id:
+                index[team_id] = ev
+    return index, any_live
+
+
+def _fetch_scoreboard(sport: str, league: str, live: bool = False) -> dict[str, dict]:
+    """Fetch scoreboard with per-league caching; returns events keyed by team id.
+
+    The cache lives SCOREBOARD_TTL while the caller's game or any game in the
+    cached board is live, and POLL_NORMAL otherwise.
+    """
     key = f"{sport}/{league}"
     now = time.monotonic()
     if key in _scoreboard_cache:
-        ts, data = _scoreboard_cache[key]
-        if now - ts < 10.0:
-            return data
+        ts, index, any_live = _scoreboard_cache[key]
+        ttl = SCOREBOARD_TTL if live or any_live else POLL_NORMAL
+        if now - ts < ttl:
+            return index
     url = f"{ESPN_BASE}/{sport}/{league}/scoreboard"
-    data = _fetch_json(url)
-    _scoreboard_cache[key] = (now, data)
-    return data
+    index, any_live = _index_scoreboard(_fetch_json(url))
+    _scoreboard_cache[key] = (now, index, any_live)
+    return index
 
 
 # ---------------------------------------------------------------------------
@@ -394,10 +475,33 @@ def _data_key(fav: dict) -> str:
     return f"{fav['league']}_{fav['team_id']}"
 
 
+def _init_game_data(favorites: list[dict]) -> list[dict]:
+    """Create game data for each favorite, returned in favorites order."""
+    games = []
+    for fav in favorites:
+        gd = _make_game_data(fav)
+        gd["our_logo"] = _logo_cache.get(f"{fav['league']}_{fav['abbr']}")
+        all_game_data[_data_key(fav)] = gd
+        games.append(gd)
+    return games
+
+
 # ---------------------------------------------------------------------------
 # Data fetching thread
 # ---------------------------------------------------------------------------
 
+def _competitor_logos(league: str, competitors: list) -> list[tuple]:
+    """(league, abbr, url) for each competitor that has a logo."""
+    wanted = []
+    for c in competitors:
+        t = c.get("team", {})
+        a = t.get("abbreviation", "")
+        url = _get_team_logo_url(t)
+        if a and url:
+            wanted.append((league, a, url))
+    return wanted
+
+
 def _poll_one_team(fav: dict, gd: dict) -> int:
     """Poll ESPN for one team's game data. Returns suggested poll interval."""
     sport, league = fav["sport"], fav["league"]
@@ -437,12 +541,7 @@ def _poll_one_team(fav: dict, gd: dict) -> int:
             away_comp = c
 
     # Ensure logos
-    for c in competitors:
-        t = c.get("team", {})
-        a = t.get("abbreviation", "")
-        url = _get_team_logo_url(t)
-        if a and url:
-            _get_logo(league, a, url)
+    _prewarm_logos(_competitor_logos(league, competitors))
 
     home_abbr = home_team.get("abbreviation", "")
     away_abbr = away_team.get("abbreviation", "")
@@ -461,37 +560,31 @@ def _poll_one_team(fav: dict, gd: dict) -> int:
 
     elif state in ("in", "post"):
         try:
-            sb = _fetch_scoreboard(sport, league)
-            for ev in sb.get("events", []):
+            ev = _fetch_scoreboard(sport, league, live=state == "in").get(fav["team_id"])
+            if ev is not None:
                 comp = ev.get("competitions", [{}])[0]
                 comps = comp.get("competitors", [])
-                abbrs = [c.get("team", {}).get("abbreviation", "") for c in comps]
-                if team_abbr in abbrs:
-                    for c in comps:
-                        t = c.get("team", {})
-                        a = t.get("abbreviation", "")
-                        url = _get_team_logo_url(t)
-                        if a and url:
-                            _get_logo(league, a, url)
-                        if c.get("homeAway") == "home":
-                            gd["home_abbr"] = a
-                            gd["home_score"] = c.get("score", "0")
-                            gd["home_logo"] = _logo_cache.get(f"{league}_{a}")
-                        else:
-                            gd["away_abbr"] = a
-                            gd["away_score"] = c.get("score", "0")
-                            gd["away_logo"] = _logo_cache.get(f"{league}_{a}")
-
-                    sb_status = comp.get("status", {})
-                    sb_type = sb_status.get("type", {})
-                    period = sb_status.get("period", 0)
-                    gd["period"] = period
-                    gd["clock"] = sb_status.get("displayClock", "")
-                    gd["period_text"] = _period_text(period, sport)
-                    gd["status_detail"] = sb_type.get("detail", "")
-                    gd["detail"] = sb_type.get("shortDetail", "")
-                    gd["state"] = sb_type.get("state", state)
-                    break
+                _prewarm_logos(_competitor_logos(league, comps))
+                for c in comps:
+                    a = c.get("team", {}).get("abbreviation", "")
+                    if c.get("homeAway") == "home":
+                        gd["home_abbr"] = a
+                        gd["home_score"] = c.get("score", "0")
+                        gd["home_logo"] = _logo_cache.get(f"{league}_{a}")
+                    else:
+                        gd["away_abbr"] = a
+                        gd["away_score"] = c.get("score", "0")
+                        gd["away_logo"] = _logo_cache.get(f"{league}_{a}")
+
+                sb_status = comp.get("status", {})
+                sb_type = sb_status.get("type", {})
+                period = sb_status.get("period", 0)
+                gd["period"] = period
+                gd["clock"] = sb_status.get("displayClock", "")
+                gd["period_text"] = _period_text(period, sport)
+                gd["status_detail"] = sb_type.get("detail", "")
+                gd["detail"] = sb_type.get("shortDetail", "")
+                gd["state"] = sb_type.get("state", state)
             else:
                 gd["home_score"] = home_comp.get("score", "0")
                 gd["away_score"] = away_comp.get("score", "0")
@@ -511,36 +604,33 @@ def _fetch_loop(favorites: list[dict]) -> None:
     n = len(favorites)
     now = time.monotonic()
 
-    # Initialize game_data and build staggered schedule
+    # Reuse game_data the display already holds and build staggered schedule
+    # (min-heap on next poll time; seq indexes favorites/games)
+    games = [all_game_data.setdefault(_data_key(fav), _make_game_data(fav))
+             for fav in favorites]
     schedule = []
     for i, fav in enumerate(favorites):
-        key = _data_key(fav)
-        all_game_data[key] = _make_game_data(fav)
         stagger = (i / max(n, 1)) * 5.0
-        schedule.append([now + stagger, fav])
+        schedule.append((now + stagger, i, fav))
+    heapq.heapify(schedule)
+    last_fetch = now - MIN_FETCH_GAP
 
     while True:
-        schedule.sort(key=lambda x: x[0])
-        entry = schedule[0]
-        next_time, fav = entry
+        next_time, seq, fav = heapq.heappop(schedule)
 
-        wait = next_time - time.monotonic()
+        # Enforce minimum gap between fetches
+        wait = max(next_time, last_fetch + MIN_FETCH_GAP) - time.monotonic()
         if wait > 0:
             time.sleep(wait)
 
-        key = _data_key(fav)
-        gd = all_game_data[key]
-
         try:
-            poll = _poll_one_team(fav, gd)
+            poll = _poll_one_team(fav, games[seq])
         except Exception as e:
             print(f"[sports] Fetch error for {fav['abbr']}: {e}")
             poll = POLL_NORMAL
 
-        entry[0] = time.monotonic() + poll
-
-        # Enforce minimum gap between fetches
-        time.sleep(MIN_FETCH_GAP)
+        last_fetch = time.monotonic()
+        heapq.heappush(schedule, (last_fetch + poll, seq, fav))
 
 
 # ---------------------------------------------------------------------------
@@ -563,37 +653,47 @@ def _create_button_listener():
 # Drawing helpers
 # ---------------------------------------------------------------------------
 
-def _draw_logo(canvas: Canvas, pixels: list | None, ox: int, oy: int) -> None:
-    if pixels is None:
+def _draw_logo(canvas: Canvas, logo: Logo | None, ox: int, oy: int) -> None:
+    if logo is None:
         return
-    for x, y, r, g, b in pixels:
-        canvas.set(ox + x, oy + y, (r, g, b))
+    rgb, mask = logo
+    canvas.blit(rgb, ox, oy, mask=mask)
 
 
 def _centered_text(canvas: Canvas, y: int, text: str, color,
                    x_min: int = 0, x_max: int = 63) -> None:
     w = len(text) * 4 - 1
     x = x_min + ((x_max - x_min + 1) - w) // 2
-    canvas.text(max(0, x), y, text, color)
+    canvas.text_cached(max(0, x), y, text, color)
 
 
 def _abbr_under_logo(canvas: Canvas, abbr: str, logo_x: int, y: int,
                      color) -> None:
     w = len(abbr) * 4 - 1
     x = logo_x + (LOGO_SIZE - w) // 2
-    canvas.text(max(0, x), y, abbr, color)
+    canvas.text_cached(max(0, x), y, abbr, color)
+
+
+# abs(sin) over one of its periods (pi), sampled for the pulsing indicators
+_PULSE_STEPS = 256
+_PULSE_LUT = [abs(math.sin(math.pi * i / _PULSE_STEPS)) for i in range(_PULSE_STEPS)]
+
+
+def _pulse(t: float, speed: float) -> float:
+    """abs(math.sin(t * speed)) from the lookup table."""
+    return _PULSE_LUT[int(t * speed * (_PULSE_STEPS / math.pi)) % _PULSE_STEPS]
 
 
 def _draw_status_dot(canvas: Canvas, gd: dict, t: float) -> None:
     age = t - gd["updated"] if gd["updated"] else 999
     if gd["state"] == "loading":
-        b = int(40 + 40 * abs(math.sin(t * 2)))
+        b = int(40 + 40 * _pulse(t, 2))
         canvas.set(1, 62, (b, b, 0))
     elif age < 120:
-        b = int(30 + 30 * abs(math.sin(t * 2)))
+        b = int(30 + 30 * _pulse(t, 2))
         canvas.set(1, 62, (0, b, 0))
     else:
-        b = int(40 + 40 * abs(math.sin(t * 2)))
+        b = int(40 + 40 * _pulse(t, 2))
         canvas.set(1, 62, (b, b // 2, 0))
 
 
@@ -605,13 +705,16 @@ def _abbr_color(abbr: str, gd: dict) -> tuple[int, int, int]:
 # Display modes
 # ---------------------------------------------------------------------------
 
-def _draw_loading(canvas: Canvas, gd: dict, t: float) -> None:
+def _draw_loading(canvas: Canvas, gd: dict) -> None:
     _centered_text(canvas, 28, "LOADING", DIM_GRAY)
+
+
+def _draw_loading_dots(canvas: Canvas, t: float) -> None:
     dots = "." * (int(t * 2) % 4)
     _centered_text(canvas, 35, dots, DIM_GRAY)
 
 
-def _draw_no_game(canvas: Canvas, gd: dict, t: float) -> None:
+def _draw_no_game(canvas: Canvas, gd: dict) -> None:
     if gd["our_logo"]:
         cx = (64 - LOGO_SIZE) // 2
         _draw_logo(canvas, gd["our_logo"], cx, LOGO_Y)
@@ -621,7 +724,7 @@ def _draw_no_game(canvas: Canvas, gd: dict, t: float) -> None:
     _centered_text(canvas, 49, "SCHEDULED", DIM_GRAY)
 
 
-def _draw_pre_game(canvas: Canvas, gd: dict, t: float) -> None:
+def _draw_pre_game(canvas: Canvas, gd: dict) -> None:
     _draw_logo(canvas, gd["away_logo"], AWAY_LOGO_X, LOGO_Y)
     _draw_logo(canvas, gd["home_logo"], HOME_LOGO_X, LOGO_Y)
 
@@ -637,14 +740,10 @@ def _draw_pre_game(canvas: Canvas, gd: dict, t: float) -> None:
     _centered_text(canvas, 47, gd["game_time"], WHITE)
 
 
-def _draw_live_game(canvas: Canvas, gd: dict, t: float) -> None:
+def _draw_live_game(canvas: Canvas, gd: dict) -> None:
     _draw_logo(canvas, gd["away_logo"], AWAY_LOGO_X, LOGO_Y)
     _draw_logo(canvas, gd["home_logo"], HOME_LOGO_X, LOGO_Y)
 
-    pulse = int(50 + 50 * abs(math.sin(t * 3)))
-    canvas.set(31, 10, (pulse, 5, 5))
-    canvas.set(32, 10, (pulse, 5, 5))
-
     away = gd["away_abbr"]
     home = gd["home_abbr"]
     _abbr_under_logo(canvas, away, AWAY_LOGO_X, ABBR_Y, _abbr_color(away, gd))
@@ -659,11 +758,17 @@ def _draw_live_game(canvas: Canvas, gd: dict, t: float) -> None:
     period_clock = f"{gd['period_text']} {gd['clock']}"
     _centered_text(canvas, 53, period_clock, AMBER)
 
+
+def _draw_live_indicators(canvas: Canvas, t: float) -> None:
+    pulse = int(50 + 50 * _pulse(t, 3))
+    canvas.set(31, 10, (pulse, 5, 5))
+    canvas.set(32, 10, (pulse, 5, 5))
+
     if int(t * 2) % 2:
         _centered_text(canvas, 59, "LIVE", LIVE_RED)
 
 
-def _draw_final(canvas: Canvas, gd: dict, t: float) -> None:
+def _draw_final(canvas: Canvas, gd: dict) -> None:
     _draw_logo(canvas, gd["away_logo"], AWAY_LOGO_X, LOGO_Y)
     _draw_logo(canvas, gd["home_logo"], HOME_LOGO_X, LOGO_Y)
 
@@ -688,18 +793,37 @@ def _draw_final(canvas: Canvas, gd: dict, t: float) -> None:
     _centered_text(canvas, 55, home_line, _abbr_color(home, gd))
 
 
+# state -> (static layer, animated overlay)
+_MODES = {
+    "loading": (_draw_loading, _draw_loading_dots),
+    "none": (_draw_no_game, None),
+    "pre": (_draw_pre_game, None),
+    "in": (_draw_live_game, _draw_live_indicators),
+    "post": (_draw_final, None),
+}
+
+# The static layer only changes when the fetcher updates a team or the display
+# switches teams, so it is drawn once per change and copied into each frame.
+_static = Canvas()
+_static_key = None
+
+
 def _render_game(canvas: Canvas, gd: dict, t: float) -> None:
+    """Draw gd's game into canvas, replacing its contents."""
+    global _static_key
+
     state = gd["state"]
-    if state == "loading":
-        _draw_loading(canvas, gd, t)
-    elif state == "none":
-        _draw_no_game(canvas, gd, t)
-    elif state == "pre":
-        _draw_pre_game(canvas, gd, t)
-    elif state == "in":
-        _draw_live_game(canvas, gd, t)
-    elif state == "post":
-        _draw_final(canvas, gd, t)
+    draw_static, draw_overlay = _MODES.get(state, (None, None))
+    key = (id(gd), state, gd["updated"])
+    if key != _static_key:
+        _static.clear()
+        if draw_static:
+            draw_static(_static, gd)
+        _static_key = key
+
+    canvas.blit(_static)
+    if draw_overlay:
+        draw_overlay(canvas, t)
     _draw_status_dot(canvas, gd, t)
 
 
@@ -762,13 +886,14 @@ def _submenu() -> list[dict]:
 
 _embed_initialized = False
 _embed_favorites = []
+_embed_games = []
 _embed_current = 0
 _embed_last_switch = 0.0
 
 
 def render(canvas, t, frame):
     """Render current team's game. Lazy-inits from saved favorites on first call."""
-    global _embed_initialized, _embed_favorites, _embed_current, _embed_last_switch
+    global _embed_initialized, _embed_favorites, _embed_games, _embed_current, _embed_last_switch
 
     if not _embed_initialized:
         _embed_favorites = _load_favorites()
@@ -777,12 +902,8 @@ def render(canvas, t, frame):
             canvas.text(4, 28, "NO TEAMS", (255, 0, 0))
             canvas.text(4, 36, "RUN SPORTS", (120, 120, 120))
             return
-        for fav in _embed_favorites:
-            _get_logo(fav["league"], fav["abbr"], fav.get("logo_url"))
-        for fav in _embed_favorites:
-            key = _data_key(fav)
-            all_game_data[key] = _make_game_data(fav)
-            all_game_data[key]["our_logo"] = _logo_cache.get(f"{fav['league']}_{fav['abbr']}")
+        _prewarm_logos((f["league"], f["abbr"], f.get("logo_url")) for f in _embed_favorites)
+        _embed_games = _init_game_data(_embed_favorites)
         threading.Thread(target=_fetch_loop, args=(_embed_favorites,), daemon=True).start()
         _embed_current = random.randrange(len(_embed_favorites))
         _embed_last_switch = time.monotonic()
@@ -794,12 +915,7 @@ def render(canvas, t, frame):
         _embed_current = (_embed_current + 1) % len(_embed_favorites)
         _embed_last_switch = now
 
-    fav = _embed_favorites[_embed_current]
-    key = _data_key(fav)
-    gd = all_game_data.get(key, _make_game_data(fav))
-
-    canvas.clear()
-    _render_game(canvas, gd, t)
+    _render_game(canvas, _embed_games[_embed_current], t)
 
 
 def main():
@@ -809,14 +925,10 @@ def main():
     print()
 
     # Pre-warm own logos
-    for fav in favorites:
-        _get_logo(fav["league"], fav["abbr"], fav.get("logo_url"))
+    _prewarm_logos((f["league"], f["abbr"], f.get("logo_url")) for f in favorites)
 
     # Initialize game data before starting fetch thread
-    for fav in favorites:
-        key = _data_key(fav)
-        all_game_data[key] = _make_game_data(fav)
-        all_game_data[key]["our_logo"] = _logo_cache.get(f"{fav['league']}_{fav['abbr']}")
+    games = _init_game_data(favorites)
 
     # Start fetch thread
     threading.Thread(target=_fetch_loop, args=(favorites,), daemon=True).start()
@@ -826,12 +938,14 @@ def main():
     sim = Simulator(canvas, title="Sports Tracker")
     sender = Sender()
     btn_sock = _create_button_listener()
+    btn_buf = bytearray(16)  # Reused receive buffer for button packets
+    btn_sel = selectors.DefaultSelector()
+    if btn_sock is not None:
+        btn_sel.register(btn_sock, selectors.EVENT_READ)
 
     current = random.randrange(len(favorites))
     overlay_until = time.monotonic() + OVERLAY_DURATION
     last_switch = time.monotonic()
-    key_up_prev = False
-    key_down_prev = False
     start = time.monotonic()
     frame = 0
 
@@ -842,29 +956,27 @@ def main():
 
             # --- Button / keyboard input ---
             switched = False
-            if btn_sock is not None:
+            # Only drain the socket when the selector says a packet is waiting
+            if btn_sock is not None and btn_sel.select(timeout=0):
                 try:
                     while True:
-                        data, _ = btn_sock.recvfrom(16)
-                        if len(data) >= 1:
-                            if data[0] == BTN_UP_CODE:
+                        n = btn_sock.recv_into(btn_buf)
+                        if n >= 1:
+                            if btn_buf[0] == BTN_UP_CODE:
                                 current = (current - 1) % len(favorites)
                                 switched = True
-                            elif data[0] == BTN_DOWN_CODE:
+                            elif btn_buf[0] == BTN_DOWN_CODE:
                                 current = (current + 1) % len(favorites)
                                 switched = True
                 except BlockingIOError:
                     pass
 
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_UP] and not key_up_prev:
-                current = (current - 1) % len(favorites)
-                switched = True
-            if keys[pygame.K_DOWN] and not key_down_prev:
-                current = (current + 1) % len(favorites)
-                switched = True
-            key_up_prev = keys[pygame.K_UP]
-            key_down_prev = keys[pygame.K_DOWN]
+            # Keyboard arrows (KEYDOWN edges collected by sim.update)
+            for k in sim.keys_down:
+                step = KEY_STEPS.get(k)
+                if step is not None:
+                    current = (current + step) % len(favorites)
+                    switched = True
 
             if not switched and len(favorites) > 1 and now - last_switch >= AUTO_ROTATE:
                 current = (current + 1) % len(favorites)
@@ -875,15 +987,10 @@ def main():
                 last_switch = now
 
             # --- Render current team ---
-            fav = favorites[current]
-            key = _data_key(fav)
-            gd = all_game_data.get(key, _make_game_data(fav))
-
-            canvas.clear()
-            _render_game(canvas, gd, t)
+            _render_game(canvas, games[current], t)
 
             if now < overlay_until:
-                _draw_overlay(canvas, fav, current, len(favorites))
+                _draw_overlay(canvas, favorites[current], current, len(favorites))
 
             # --- Update display ---
             if not sim.update():
@@ -895,6 +1002,7 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
+        btn_sel.close()
         if btn_sock is not None:
             btn_sock.close()
         sender.close()
@@ -323,8 +323,8 @@ def render(canvas: Canvas, t: float, frame: int) -> None:
     loc = "GREENPOINT"
     lw = len(loc) * 4 - 1
     lx = (64 - lw) // 2
-    hue = (t * 25) % 360
-    canvas.text(lx, 52, loc, Canvas.hsv(hue, 0.35, 0.85))
+    hue = int(t * 25) % 360
+    canvas.text(lx, 52, loc, Canvas.hsv_lut(0.35, 0.85)[hue])
 
     # --- Status dot (bottom-left, like sports.py) ---
     age = time.monotonic() - weather_data.get("updated", 0)
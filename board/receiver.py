@@ -6,12 +6,15 @@
 #           Row 0xFFFF = frame-done signal (triggers display refresh).
 #
 # Desktop sender pre-converts RGB888 to RGB565 and paces packets.
-# Board uses memoryview copy + arrayblit for zero per-pixel Python work.
+# Board acks every ACK_EVERY rows and every refreshed frame by echoing that
+# packet's 2-byte header to the sender's socket, so the sender can send more rows
+# as soon as the mailbox has drained instead of always waiting out a fixed pause.
+# Board copies each row straight into the bitmap's pixel memory (arrayblit on
+# firmware without Bitmap buffer support) for zero per-pixel Python work.
 #
 # Pair with the desktop `ledmatrix` package sender:
 #   MATRIX_IP=<board_ip> python apps/rainbow.py
 
-import array
 import time
 import board
 import digitalio
@@ -32,6 +35,7 @@ BUTTON_PORT = 7778
 BTN_UP_CODE = 0x01
 BTN_DOWN_CODE = 0x02
 DEBOUNCE_S = 0.25
+ACK_EVERY = 4  # Rows per ack
 
 # --- WiFi ---
 ssid = getenv("CIRCUITPY_WIFI_SSID")
@@ -86,9 +90,14 @@ group = displayio.Group()
 group.append(tile_grid)
 display.root_group = group
 
-# Pre-allocate row buffer and its byte-level memoryview for zero-copy receive
-row_buf = array.array("H", [0] * MATRIX_WIDTH)
-row_buf_bytes = memoryview(row_buf).cast("B")
+# Byte view of the bitmap's own pixel memory, so a row lands with one slice copy.
+# Needs Bitmap buffer support and unpadded 16-bit rows; otherwise use arrayblit.
+try:
+    bitmap_bytes = memoryview(bitmap).cast("B")
+    if len(bitmap_bytes) != MATRIX_WIDTH * MATRIX_HEIGHT * 2:
+        bitmap_bytes = None
+except (TypeError, NotImplementedError):
+    bitmap_bytes = None
 
 # --- Show startup pattern (green border = ready) ---
 GREEN = ((0 & 0xF8) << 8) | ((255 & 0xFC) << 3) | (0 >> 3)
@@ -112,6 +121,11 @@ ROW_BYTES = MATRIX_WIDTH * 2
 PACKET_SIZE = HEADER_SIZE + ROW_BYTES
 recv_buf = bytearray(PACKET_SIZE)
 recv_mv = memoryview(recv_buf)
+# Persistent views of the payload inside recv_buf: rows are used where they
+# land, with no intermediate row buffer
+row_bytes = recv_mv[HEADER_SIZE:HEADER_SIZE + ROW_BYTES]
+row_pixels = row_bytes.cast("H")  # uint16 RGB565 elements for arrayblit
+ack_header = recv_mv[:HEADER_SIZE]  # Acks echo the header of the packet handled
 
 frame_count = 0
 last_fps_time = time.monotonic()
@@ -120,6 +134,7 @@ btn_up_prev = False
 btn_down_prev = False
 last_btn_time = 0.0
 btn_packet = bytearray(1)
+rows_since_ack = 0
 
 # --- Main receive loop ---
 while True:
@@ -132,7 +147,14 @@ while True:
     row_num = (recv_buf[0] << 8) | recv_buf[1]
 
     if row_num == FRAME_DONE:
+        if bitmap_bytes is not None:
+            bitmap.dirty()  # Direct memory writes bypass dirty tracking
         display.refresh()
+        rows_since_ack = 0
+        try:
+            sock.sendto(ack_header, addr)
+        except Exception:
+            pass
         frame_count += 1
         now = time.monotonic()
         if now - last_fps_time >= 5.0:
@@ -145,11 +167,21 @@ while True:
     if row_num >= MATRIX_HEIGHT or nbytes < PACKET_SIZE:
         continue
 
-    # C-level memcpy: copy RGB565 bytes into row buffer (no Python loop)
-    row_buf_bytes[:] = recv_mv[HEADER_SIZE:HEADER_SIZE + ROW_BYTES]
-
-    # Blit entire row in one C-level call
-    bitmaptools.arrayblit(bitmap, row_buf, x1=0, y1=row_num, x2=MATRIX_WIDTH, y2=row_num + 1)
+    if bitmap_bytes is not None:
+        # C-level memcpy: RGB565 bytes straight into the bitmap row
+        offset = row_num * ROW_BYTES
+        bitmap_bytes[offset:offset + ROW_BYTES] = row_bytes
+    else:
+        # Blit entire row in one C-level call, straight from the receive buffer
+        bitmaptools.arrayblit(bitmap, row_pixels, x1=0, y1=row_num, x2=MATRIX_WIDTH, y2=row_num + 1)
+
+    rows_since_ack += 1
+    if rows_since_ack == ACK_EVERY:
+        rows_since_ack = 0
+        try:
+            sock.sendto(ack_header, addr)
+        except Exception:
+            pass
 
     # --- Button polling ---
     now = time.monotonic()
@@ -1,8 +1,11 @@
 """64x64 RGB pixel buffer with drawing primitives."""
 
 import colorsys
+import functools
 import math
 
+import numpy as np
+
 # Type alias for RGB tuples
 Color = tuple[int, int, int]
 
@@ -53,6 +56,26 @@ _FONT_3X5 = {
     'Z': [0b111, 0b001, 0b010, 0b100, 0b111],
 }
 
+# Lit (col, row) offsets of each glyph, unpacked once from the bitmaps above
+_GLYPH_PIXELS = {
+    ch: tuple((col, row) for row, bits in enumerate(rows)
+              for col in range(3) if bits & (1 << (2 - col)))
+    for ch, rows in _FONT_3X5.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _text_mask(string: str, spacing: int) -> np.ndarray:
+    """Rasterize a string in the 3x5 font to a read-only (5, width) bool mask."""
+    upper = string.upper()
+    step = 3 + spacing
+    mask = np.zeros((5, max(len(upper) * step, 0)), dtype=bool)
+    for i, ch in enumerate(upper):
+        for col, row in _GLYPH_PIXELS.get(ch, ()):
+            mask[row, i * step + col] = True
+    mask.flags.writeable = False
+    return mask
+
 
 class Canvas:
     """64x64 RGB pixel buffer with drawing primitives.
@@ -68,14 +91,7 @@ class Canvas:
 
     def clear(self, color: Color = (0, 0, 0)) -> None:
         """Fill entire canvas with a color (default black)."""
-        if color == (0, 0, 0):
-            self.buffer[:] = b'\x00' * len(self.buffer)
-        else:
-            r, g, b = color
-            for i in range(0, len(self.buffer), 3):
-                self.buffer[i] = r
-                self.buffer[i + 1] = g
-                self.buffer[i + 2] = b
+        self.buffer[:] = bytes(color) * (self.width * self.height)
 
     def set(self, x: int, y: int, color: Color) -> None:
         """Set a single pixel. Out-of-bounds writes are silently ignored."""
@@ -99,9 +115,14 @@ class Canvas:
     def rect(self, x: int, y: int, w: int, h: int, color: Color, filled: bool = True) -> None:
         """Draw a rectangle. If filled=False, draws outline only."""
         if filled:
-            for py in range(y, y + h):
-                for px in range(x, x + w):
-                    self.set(px, py, color)
+            # One clipped slice assignment per row
+            x0, x1 = max(x, 0), min(x + w, self.width)
+            if x0 >= x1:
+                return
+            row = bytes(color) * (x1 - x0)
+            for py in range(max(y, 0), min(y + h, self.height)):
+                idx = (py * self.width + x0) * 3
+                self.buffer[idx:idx + len(row)] = row
         else:
             self.line(x, y, x + w - 1, y, color)
             self.line(x, y + h - 1, x + w - 1, y + h - 1, color)
@@ -110,13 +131,29 @@ class Canvas:
 
     def line(self, x0: int, y0: int, x1: int, y1: int, color: Color) -> None:
         """Draw a line using Bresenham's algorithm."""
+        if y0 == y1:
+            # Horizontal (also every span of a filled circle): one clipped slice
+            lo, hi = max(min(x0, x1), 0), min(max(x0, x1), self.width - 1)
+            if 0 <= y0 < self.height and lo <= hi:
+                idx = (y0 * self.width + lo) * 3
+                self.buffer[idx:idx + (hi - lo + 1) * 3] = bytes(color) * (hi - lo + 1)
+            return
+        if x0 == x1:
+            lo, hi = max(min(y0, y1), 0), min(max(y0, y1), self.height - 1)
+            if 0 <= x0 < self.width and lo <= hi:
+                self._pixels()[lo:hi + 1, x0] = color
+            return
+        buf, width, height = self.buffer, self.width, self.height
+        rgb = bytes(color)
         dx = abs(x1 - x0)
         dy = -abs(y1 - y0)
         sx = 1 if x0 < x1 else -1
         sy = 1 if y0 < y1 else -1
         err = dx + dy
         while True:
-            self.set(x0, y0, color)
+            if 0 <= x0 < width and 0 <= y0 < height:
+                idx = (y0 * width + x0) * 3
+                buf[idx:idx + 3] = rgb
             if x0 == x1 and y0 == y1:
                 break
             e2 = 2 * err
@@ -155,24 +192,104 @@ class Canvas:
 
     def text(self, x: int, y: int, string: str, color: Color, spacing: int = 1) -> None:
         """Draw text using built-in 3x5 pixel font. Uppercase only."""
+        buf, width, height = self.buffer, self.width, self.height
+        rgb = bytes(color)
         cursor_x = x
         for ch in string.upper():
-            glyph = _FONT_3X5.get(ch)
-            if glyph is None:
-                cursor_x += 3 + spacing
-                continue
-            for row_idx, row_bits in enumerate(glyph):
-                for col in range(3):
-                    if row_bits & (1 << (2 - col)):
-                        self.set(cursor_x + col, y + row_idx, color)
+            for col, row in _GLYPH_PIXELS.get(ch, ()):
+                px, py = cursor_x + col, y + row
+                if 0 <= px < width and 0 <= py < height:
+                    idx = (py * width + px) * 3
+                    buf[idx:idx + 3] = rgb
             cursor_x += 3 + spacing
 
+    def text_cached(self, x: int, y: int, string: str, color: Color, spacing: int = 1) -> None:
+        """Same as text(), but each string's glyph mask is rasterized once and cached.
+
+        Use for text that repeats frame after frame (captions, labels).
+        """
+        mask = _text_mask(string, spacing)
+        h, w = mask.shape
+        x0, x1 = max(x, 0), min(x + w, self.width)
+        y0, y1 = max(y, 0), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self._pixels()[y0:y1, x0:x1][mask[y0 - y:y1 - y, x0 - x:x1 - x]] = color
+
+    def blit(self, src, x: int = 0, y: int = 0, mask=None) -> None:
+        """Copy an RGB image onto the canvas with its top-left corner at (x, y).
+
+        src is another Canvas or any C-contiguous (height, width, 3) uint8
+        buffer such as a NumPy array. Rows are copied as whole slices; parts
+        outside the canvas are clipped. If mask is given (a (height, width)
+        bool array), only pixels where it is True are copied.
+        """
+        if mask is not None:
+            if isinstance(src, Canvas):
+                src = src._pixels()
+            h, w = mask.shape
+            x0, x1 = max(x, 0), min(x + w, self.width)
+            y0, y1 = max(y, 0), min(y + h, self.height)
+            if x0 < x1 and y0 < y1:
+                m = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+                self._pixels()[y0:y1, x0:x1][m] = src[y0 - y:y1 - y, x0 - x:x1 - x][m]
+            return
+        if isinstance(src, Canvas):
+            w, h, data = src.width, src.height, memoryview(src.buffer)
+        else:
+            data = memoryview(src)
+            h, w = data.shape[0], data.shape[1]
+            data = data.cast("B")
+        if x == 0 and y == 0 and w == self.width and h == self.height:
+            self.buffer[:] = data
+            return
+        x0, x1 = max(x, 0), min(x + w, self.width)
+        if x0 >= x1:
+            return
+        row_bytes = (x1 - x0) * 3
+        for sy in range(max(0, -y), min(h, self.height - y)):
+            src_idx = (sy * w + x0 - x) * 3
+            dst_idx = ((y + sy) * self.width + x0) * 3
+            self.buffer[dst_idx:dst_idx + row_bytes] = data[src_idx:src_idx + row_bytes]
+
+    def _pixels(self) -> np.ndarray:
+        """Writable (height, width, 3) NumPy view of the buffer (no copy)."""
+        return np.frombuffer(self.buffer, dtype=np.uint8).reshape(self.height, self.width, 3)
+
     @staticmethod
     def hsv(h: float, s: float = 1.0, v: float = 1.0) -> Color:
         """Convert HSV to RGB color tuple. h is 0-360, s and v are 0-1."""
         r, g, b = colorsys.hsv_to_rgb(h / 360.0, s, v)
         return (int(r * 255), int(g * 255), int(b * 255))
 
+    @staticmethod
+    def hsv_array(h, s: float = 1.0, v: float = 1.0) -> np.ndarray:
+        """Vectorized hsv(): array of hues (0-360) -> uint8 array of shape h.shape + (3,)."""
+        # Same float steps as colorsys, (h / 360) * 6, so hues >= 0 match hsv() exactly
+        h6 = (np.asarray(h, dtype=np.float64) / 360.0) * 6.0
+        sector = np.floor(h6)
+        f = h6 - sector
+        sector = sector.astype(np.int32) % 6
+        vv = np.full_like(f, v)
+        p = np.full_like(f, v * (1.0 - s))
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        r = np.choose(sector, (vv, q, p, p, t, vv))
+        g = np.choose(sector, (t, vv, vv, q, p, p))
+        b = np.choose(sector, (p, p, t, vv, vv, q))
+        return (np.stack((r, g, b), axis=-1) * 255).astype(np.uint8)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def hsv_lut(s: float = 1.0, v: float = 1.0) -> np.ndarray:
+        """Read-only (360, 3) uint8 table of hsv() at whole-degree hues, memoized per (s, v).
+
+        Index it with integer hues 0-359, e.g. lut[hues.astype(np.intp) % 360].
+        """
+        lut = np.array([Canvas.hsv(h, s, v) for h in range(360)], dtype=np.uint8)
+        lut.flags.writeable = False
+        return lut
+
     @staticmethod
     def rgb(r: int, g: int, b: int) -> Color:
         """Convenience: clamp and return an RGB tuple."""
@@ -183,11 +300,17 @@ class Canvas:
         """Convert 0xRRGGBB integer to (R, G, B) tuple."""
         return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
 
-    def get_row(self, y: int) -> bytes:
-        """Get raw RGB bytes for a single row."""
+    def get_row(self, y: int) -> memoryview:
+        """Get a zero-copy view of the raw RGB bytes for a single row.
+
+        The view tracks later drawing; call bytes() on it to keep a snapshot.
+        """
         start = y * self.width * 3
-        return bytes(self.buffer[start:start + self.width * 3])
+        return memoryview(self.buffer)[start:start + self.width * 3]
+
+    def get_buffer(self) -> memoryview:
+        """Get a zero-copy view of the entire pixel buffer.
 
-    def get_buffer(self) -> bytes:
-        """Get the entire pixel buffer as bytes."""
-        return bytes(self.buffer)
+        The view tracks later drawing; call bytes() on it to keep a snapshot.
+        """
+        return memoryview(self.buffer)
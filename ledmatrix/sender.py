@@ -4,12 +4,22 @@ Protocol (per packet):
   - Bytes 0-1: row number (uint16 big-endian), 0xFFFF = frame-done signal
   - Bytes 2+:  64 * 2 = 128 bytes of RGB565 pixel data (little-endian)
 
-One packet per row, 64 packets per frame + 1 frame-done signal.
+One packet per changed row + 1 frame-done signal per frame. The board keeps its
+bitmap between frames, so rows identical to the last frame are skipped; every
+FULL_FRAME_INTERVAL frames all 64 rows are resent to repair any dropped packet.
 Rows are sent in small bursts with pauses between them, because CircuitPython's
 lwIP UDP receive mailbox defaults to only 6 packets (CONFIG_LWIP_UDP_RECVMBOX_SIZE).
 Sending faster than the board can drain this mailbox causes silent packet drops,
 visible as stale/missing rows on the display.
 
+The board acks every 4th row it handles and every refreshed frame by echoing
+that packet's 2-byte header back to the sending socket. Rows go out in order, so
+an ack for row N means every row sent before it has left the mailbox too, even if
+some were lost. The sender keeps at most BURST_SIZE unacknowledged rows in flight
+and sends on as soon as an ack frees room; BURST_DELAY / FRAME_DELAY only bound
+each wait, and a wait that times out counts as drained, so a board that never
+acks is paced exactly as before.
+
 References:
   - lwIP UDP mailbox default (6): https://github.com/espressif/esp-idf/blob/master/components/lwip/Kconfig
   - ESP32 UDP packet bunching: https://forum.arduino.cc/t/esp32-wifi-udp-bunching-packets/1162055
@@ -19,10 +29,11 @@ References:
 Board listens on UDP port 7777.
 """
 
+import bisect
 import os
+import select
 import socket
 import struct
-import time
 
 import numpy as np
 
@@ -31,8 +42,12 @@ from ledmatrix.canvas import Canvas
 MATRIX_PORT = 7777
 FRAME_DONE = 0xFFFF
 BURST_SIZE = 4  # Rows per burst (must fit in board's 6-packet UDP mailbox)
-BURST_DELAY = 0.004  # Pause between bursts for board to drain mailbox
-FRAME_DELAY = 0.005  # Post-frame delay for board display.refresh()
+BURST_DELAY = 0.004  # Max pause between bursts for board to drain mailbox
+FRAME_DELAY = 0.005  # Max post-frame pause for board display.refresh()
+FULL_FRAME_INTERVAL = 30  # Resend unchanged rows this often (frames)
+SEND_BUFFER_SIZE = 128 * 1024  # Room for a full frame of bursts without blocking
+
+_FRAME_DONE_PACKET = struct.pack(">H", FRAME_DONE)
 
 
 class Sender:
@@ -43,14 +58,21 @@ class Sender:
         self.port = port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.enabled = bool(self.host)
-        if not self.enabled:
+        self._packets: np.ndarray | None = None  # (rows, 2 + width*2) packet buffer
+        self._frames_since_full = 0
+        self._ack_buf = bytearray(16)
+        if self.enabled:
+            # Connected UDP socket: the destination is resolved once here, so
+            # each per-row send() skips the address handling sendto() repeats
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+            self.sock.connect((self.host, self.port))
+        else:
             print("[sender] No MATRIX_IP set, streaming disabled. Set MATRIX_IP env var to enable.")
 
     def send_frame(self, canvas: Canvas) -> None:
-        """Send the entire canvas as individual row packets + frame-done."""
+        """Send the canvas rows that changed as individual row packets + frame-done."""
         if not self.enabled:
             return
-        addr = (self.host, self.port)
         width = canvas.width
         height = canvas.height
         # Vectorized RGB888 -> RGB565 conversion (entire frame at once)
@@ -59,21 +81,58 @@ class Sender:
         g = rgb[:, :, 1].astype(np.uint16)
         b = rgb[:, :, 2].astype(np.uint16)
         rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-        frame_data = rgb565.astype('<u2').tobytes()
-        # Send rows in bursts that fit the board's UDP receive mailbox
-        packet = bytearray(2 + width * 2)
-        row_bytes = width * 2
-        for y in range(height):
-            packet[0] = (y >> 8) & 0xFF
-            packet[1] = y & 0xFF
-            offset = y * row_bytes
-            packet[2:] = frame_data[offset:offset + row_bytes]
-            self.sock.sendto(packet, addr)
-            if (y + 1) % BURST_SIZE == 0:
-                time.sleep(BURST_DELAY)
-        # Frame done signal, then wait for board to call display.refresh()
-        self.sock.sendto(struct.pack(">H", FRAME_DONE), addr)
-        time.sleep(FRAME_DELAY)
+        payload = rgb565.astype('<u2').view(np.uint8).reshape(height, width * 2)
+        # Every row packet lives in one array; the row-number headers never change
+        # and the payload columns still hold what the board was last sent
+        packets = self._packets
+        if packets is None or packets.shape != (height, 2 + width * 2):
+            packets = np.empty((height, 2 + width * 2), dtype=np.uint8)
+            packets[:, :2] = np.arange(height, dtype='>u2').view(np.uint8).reshape(height, 2)
+            self._packets = packets
+            self._frames_since_full = FULL_FRAME_INTERVAL
+        if self._frames_since_full >= FULL_FRAME_INTERVAL:
+            rows = range(height)
+            self._frames_since_full = 0
+        else:
+            rows = np.flatnonzero((payload != packets[:, 2:]).any(axis=1)).tolist()
+            self._frames_since_full += 1
+        packets[:, 2:] = payload
+        try:
+            # Late acks from the previous frame would release a burst early
+            while select.select([self.sock], [], [], 0)[0]:
+                self.sock.recv_into(self._ack_buf)
+            # Keep at most BURST_SIZE unacked rows in the board's UDP receive mailbox
+            sent = acked = 0  # rows sent / rows known to have left the mailbox
+            for y in rows:
+                while sent - acked >= BURST_SIZE:
+                    ack = self._wait_for_ack(BURST_DELAY)
+                    if ack is None:
+                        acked = sent  # No ack in time: assume drained, like a fixed pause
+                    elif ack != FRAME_DONE:
+                        # Rows were sent in ascending order: all up to `ack` are handled or lost
+                        acked = max(acked, bisect.bisect_right(rows, ack, 0, sent))
+                self.sock.send(packets[y])
+                sent += 1
+            # Frame done signal, then wait for board to call display.refresh()
+            self.sock.send(_FRAME_DONE_PACKET)
+            ack = 0
+            while ack is not None and ack != FRAME_DONE:  # Skip row acks still in flight
+                ack = self._wait_for_ack(FRAME_DELAY)
+        except ConnectionRefusedError:
+            # A connected UDP socket reports the ICMP port-unreachable from an
+            # earlier packet (board not listening yet); resend everything next frame
+            self._frames_since_full = FULL_FRAME_INTERVAL
+
+    def _wait_for_ack(self, timeout: float) -> int | None:
+        """Wait up to `timeout` seconds for the board's next ack.
+
+        Returns the acked row number (FRAME_DONE for a refreshed frame), or None
+        on timeout.
+        """
+        if not select.select([self.sock], [], [], timeout)[0]:
+            return None
+        n = self.sock.recv_into(self._ack_buf)
+        return (self._ack_buf[0] << 8) | self._ack_buf[1] if n >= 2 else None
 
     def close(self) -> None:
         self.sock.close()
@@ -19,14 +19,19 @@ class Simulator:
         self.clock = pygame.time.Clock()
         # Small surface at actual matrix resolution, then upscale
         self.surface = pygame.Surface((canvas.width, canvas.height))
+        # Keys pressed (KEYDOWN edges) during the last update()
+        self.keys_down: list[int] = []
 
     def update(self) -> bool:
         """Blit canvas to screen. Returns False if window was closed."""
+        self.keys_down = []
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+                self.keys_down.append(event.key)
 
         # Write pixel buffer directly to the small surface
         buf = self.canvas.buffer
@@ -14,6 +14,8 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
 from pathlib import Path
+
+import numpy as np
 from PIL import Image
 
 # Add project root to path
@@ -131,26 +133,20 @@ def record_gtrain():
 # Sports: render mock game states (pre, live, final, no-game)
 # ---------------------------------------------------------------------------
 
-def _load_logo_from_disk(league: str, abbr: str, size: int = 22) -> list | None:
-    """Load a cached logo PNG from disk into the pixel list format sports.py expects."""
+def _load_logo_from_disk(league: str, abbr: str, size: int = 22) -> tuple | None:
+    """Load a cached logo PNG from disk into the (rgb, mask) format sports.py expects."""
     cache_file = ROOT / "apps" / ".logo_cache" / f"{league}_{abbr.lower()}_{size}.png"
     if not cache_file.exists():
         return None
     img = Image.open(cache_file).convert("RGB")
-    pixels = []
-    for y in range(img.height):
-        for x in range(img.width):
-            r, g, b = img.getpixel((x, y))
-            r, g, b = int(r * 0.5), int(g * 0.5), int(b * 0.5)
-            if r > 2 or g > 2 or b > 2:
-                pixels.append((x, y, r, g, b))
-    return pixels
+    rgb = np.asarray(img, dtype=np.uint8) >> 1
+    return rgb, rgb.max(axis=2) > 2
 
 
 def record_sports():
     from apps.sports import (
-        _draw_pre_game, _draw_live_game, _draw_final, _draw_no_game,
-        _draw_status_dot, _hex_to_led, _centered_text, _draw_logo,
+        _draw_pre_game, _draw_live_game, _draw_live_indicators, _draw_final,
+        _draw_no_game, _draw_status_dot, _hex_to_led, _centered_text, _draw_logo,
         _get_logo, LOGO_Y, AWAY_LOGO_X, HOME_LOGO_X, ABBR_Y,
         DIM_WHITE, WHITE, DIM_GRAY, AMBER, LIVE_RED,
     )
@@ -187,7 +183,8 @@ def record_sports():
     def mock_render(canvas, t, frame):
         gd["updated"] = t - 1.0
         canvas.clear()
-        _draw_live_game(canvas, gd, t)
+        _draw_live_game(canvas, gd)
+        _draw_live_indicators(canvas, t)
         _draw_status_dot(canvas, gd, t)
 
     render_gif("sports", mock_render)
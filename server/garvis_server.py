@@ -413,6 +413,7 @@ class ElevenLabsTTS:
         params = [
             f"model_id={ELEVENLABS_MODEL_ID}",
             f"output_format={ELEVENLABS_OUTPUT_FORMAT}",
+            "optimize_streaming_latency=3",
             "inactivity_timeout=180",
         ]
         url = f"{url}?{'&'.join(params)}"